@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Load test for scoring_service.py
+================================
+Opens N keep-alive connections to a locally running scoring service and
+fires single or batch scoring requests for a fixed duration, then prints
+throughput and client-side latency percentiles.
+
+Usage:
+    python scoring_service.py &                        # start the service first
+    python load_test_service.py                        # 10 connections, 10s, /score
+    python load_test_service.py --batch 50 --connections 4 --duration 30
+    python load_test_service.py --items output/data_20251226_1440.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from pathlib import Path
+from typing import Dict, List
+
+
+SAMPLE_ITEMS = [
+    {
+        "title": "Tesla Robotaxi Launch: Musk Announces 2026 Rollout in Dubai",
+        "description": "Elon Musk confirmed Tesla will launch its robotaxi service in Dubai by 2026, "
+                       "threatening 500,000 driver jobs in the Gulf region.",
+        "source": "Reuters",
+        "priority": 1,
+    },
+    {
+        "title": "Gold Hits $3,500 as Central Banks Stockpile Amid Dollar Concerns",
+        "description": "Gold prices reached record $3,500 per ounce as central banks, including "
+                       "Saudi Arabia and UAE, increase reserves.",
+        "source": "Bloomberg",
+        "priority": 1,
+    },
+    {
+        "title": "Local Chicago City Council Approves New Parking Meters",
+        "description": "Chicago aldermen voted 35-15 to approve new smart parking meters downtown.",
+        "source": "Chicago Tribune",
+        "priority": 3,
+    },
+]
+
+
+def load_items(path: Path) -> List[Dict]:
+    """Use the items of a saved scan (data_*.json) as realistic payloads."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [entry["item"] for entry in data.get("items", []) if "item" in entry] or SAMPLE_ITEMS
+
+
+async def worker(host: str, port: int, path: str, bodies: List[bytes], deadline: float,
+                 latencies: List[float], errors: List[str]):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            body = random.choice(bodies)
+            request = (
+                f"POST {path} HTTP/1.1\r\n"
+                f"Host: {host}:{port}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n\r\n"
+            ).encode("latin-1") + body
+            
+            started = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append((time.perf_counter() - started) * 1000)
+            
+            status = status_line.split()[1:2]
+            if status != [b"200"]:
+                errors.append(status_line.decode("latin-1").strip())
+    finally:
+        writer.close()
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(int(len(sorted_values) * pct / 100), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+async def run(args):
+    items = load_items(args.items) if args.items else SAMPLE_ITEMS
+    if args.batch > 1:
+        path = "/score/batch"
+        bodies = [json.dumps({"items": random.choices(items, k=args.batch)}).encode() for _ in range(20)]
+    else:
+        path = "/score"
+        bodies = [json.dumps({"item": item}).encode() for item in items]
+    
+    latencies: List[float] = []
+    errors: List[str] = []
+    deadline = time.perf_counter() + args.duration
+    started = time.perf_counter()
+    await asyncio.gather(*[
+        worker(args.host, args.port, path, bodies, deadline, latencies, errors)
+        for _ in range(args.connections)
+    ])
+    elapsed = time.perf_counter() - started
+    
+    latencies.sort()
+    requests = len(latencies)
+    print("=" * 60)
+    print(f"Load test: {path} x {args.connections} connections for {args.duration}s")
+    print("=" * 60)
+    print(f"Requests:     {requests} ({requests / elapsed:.0f} req/s)")
+    print(f"Items scored: {requests * max(args.batch, 1)} ({requests * max(args.batch, 1) / elapsed:.0f} items/s)")
+    print(f"Errors:       {len(errors)}" + (f" (first: {errors[0]})" if errors else ""))
+    print(f"Latency ms:   p50={percentile(latencies, 50):.2f}  p90={percentile(latencies, 90):.2f}  "
+          f"p99={percentile(latencies, 99):.2f}  max={latencies[-1] if latencies else 0:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the local scoring service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--connections", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--batch", type=int, default=1, help="Items per request (>1 uses /score/batch)")
+    parser.add_argument("--items", type=Path, help="data_*.json file to draw items from")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,17 +6,51 @@ Automated system to scan RSS feeds, score against Channel DNA,
 and generate content recommendations.
 
 Usage:
-    python main.py                    # Run full scan
+    python main.py                    # Scan feeds that are due
     python main.py --test             # Test with sample data
     python main.py --synopsis <index> # Generate synopsis for item #index
+    python main.py --all-feeds        # Full scan ignoring per-feed schedules
+    python main.py --feed-health      # Show per-feed health / circuit breaker state
+    python main.py --search <words>   # Search every item archived by past scans
+    python main.py --record [--all-feeds]
+                                      # Scan and keep raw feed payloads in output/recordings
+    python main.py --replay <bundle>  # Re-run a recorded scan offline and time each stage
+    python main.py --coordinator [--all-feeds]
+                                      # Scan through the job queue, merging worker results
+    python main.py --worker           # Pull fetch/score jobs from the queue (run on any node)
+    python main.py --channels <dna.json> [<dna.json> ...]
+                                      # One scan, one report per channel
 """
 
 import json
 import re
 import os
 import sys
+import csv
+import base64
 import hashlib
-from datetime import datetime, timedelta
+import heapq
+import math
+import mmap
+import socket
+import sqlite3
+import struct
+import time
+import zlib
+import threading
+import http.client
+import io
+import urllib.parse
+import urllib.request
+import xml.etree.ElementTree as ET
+import zipfile
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from html.parser import HTMLParser
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
@@ -28,6 +62,24 @@ except ImportError:
     HAS_FEEDPARSER = False
     print("⚠️  feedparser not installed. Run: pip install feedparser")
 
+try:
+    import brotli  # optional: enables br-compressed transfers
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+try:
+    import redis  # optional: Redis-backed job queue for distributed scans
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+try:
+    import fcntl  # POSIX only: serializes archive writers across processes
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
 try:
     import anthropic
     HAS_ANTHROPIC = True
@@ -44,10 +96,34 @@ BASE_DIR = Path(__file__).parent
 CONFIG_DIR = BASE_DIR / "config"
 OUTPUT_DIR = BASE_DIR / "output"
 LOGS_DIR = BASE_DIR / "logs"
+STATE_DIR = BASE_DIR / "state"
 
 # Ensure directories exist
 OUTPUT_DIR.mkdir(exist_ok=True)
 LOGS_DIR.mkdir(exist_ok=True)
+STATE_DIR.mkdir(exist_ok=True)
+
+
+def load_state(path: Optional[Path], what: str, fallback: str = "starting fresh") -> Optional[Dict]:
+    """Read a JSON state file; None (with a warning if it was unreadable) when there is none."""
+    if not path or not path.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️  Could not load {what} ({e}), {fallback}")
+        return None
+
+
+def save_state(path: Optional[Path], data, indent: Optional[int] = None):
+    """Write a JSON state file atomically (tmp file + rename); no-op without a path."""
+    if not path:
+        return
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+    os.replace(tmp_path, path)
 
 
 # ============================================================
@@ -58,9 +134,16 @@ class ChannelDNA:
     """Loads and provides access to Channel DNA configuration."""
     
     def __init__(self, config_path: Path = CONFIG_DIR / "channel_dna.json"):
+        self.config_path = Path(config_path)
         with open(config_path, 'r', encoding='utf-8') as f:
             self.data = json.load(f)
     
+    @property
+    def slug(self) -> str:
+        """File-name friendly channel identifier."""
+        name = self.data.get("channel_name_en") or self.config_path.stem
+        return re.sub(r'\W+', '_', name).strip('_').lower()
+    
     @property
     def positive_keywords(self) -> Dict[str, List[str]]:
         return self.data.get("positive_keywords", {})
@@ -81,6 +164,10 @@ class ChannelDNA:
     def winning_topics(self) -> List[Dict]:
         return self.data.get("winning_topics", [])
     
+    @property
+    def competitor_coverage(self) -> Dict:
+        return self.data.get("competitor_coverage", {})
+    
     def get_all_positive_keywords(self) -> List[str]:
         """Flatten all positive keywords into one list."""
         all_keywords = []
@@ -89,67 +176,1207 @@ class ChannelDNA:
         return all_keywords
 
 
+# ============================================================
+# HTTP CLIENT
+# ============================================================
+
+class HTTPError(Exception):
+    """Raised for non-2xx responses."""
+    
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status} for {url}")
+        self.status = status
+        self.url = url
+
+
+class PooledResponse:
+    """Streaming, transparently decompressed response that returns its connection to the pool."""
+    
+    CHUNK_SIZE = 16 * 1024
+    
+    def __init__(self, client: "HTTPClient", key: Tuple, conn, response, url: str):
+        self.client = client
+        self.key = key
+        self.conn = conn
+        self.response = response
+        self.url = url
+        self.status = response.status
+        self.headers = response.headers
+        self._buffer = b""
+        self._eof = False
+        
+        encoding = (response.getheader("Content-Encoding") or "").lower()
+        if encoding == "gzip":
+            self._decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            self._decoder = zlib.decompressobj()
+        elif encoding == "br" and HAS_BROTLI:
+            self._decoder = brotli.Decompressor()
+        else:
+            self._decoder = None
+    
+    def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            raw = self.response.read(self.CHUNK_SIZE)
+            self.client._count(self.key, "bytes_wire", len(raw))
+            if not raw:
+                self._eof = True
+                if self._decoder and hasattr(self._decoder, "flush"):
+                    self._buffer += self._decoder.flush()
+                break
+            if self._decoder is None:
+                self._buffer += raw
+            elif hasattr(self._decoder, "decompress"):
+                self._buffer += self._decoder.decompress(raw)
+            else:
+                self._buffer += self._decoder.process(raw)
+        
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+    
+    def close(self):
+        """Drain what is left (up to a limit) so the connection can be kept alive."""
+        if self.conn is None:
+            return
+        reusable = not self.response.will_close
+        drained = 0
+        while reusable and not self.response.isclosed():
+            chunk = self.response.read(self.CHUNK_SIZE)
+            drained += len(chunk)
+            if not chunk:
+                break
+            if drained > self.client.drain_limit:
+                reusable = False
+        self.client._release(self.key, self.conn, reusable)
+        self.conn = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+class HTTPClient:
+    """
+    Shared outbound HTTP layer.
+    
+    Keeps idle keep-alive connections per (scheme, host, port), negotiates
+    gzip/deflate (and brotli when installed) and follows redirects. Thread
+    safe: a connection is only ever used by the thread that checked it out.
+    Honours HTTP(S)_PROXY / NO_PROXY like urllib: https is tunnelled with
+    CONNECT, plain http is sent to the proxy with absolute URLs.
+    """
+    
+    REDIRECT_CODES = {301, 302, 303, 307, 308}
+    USER_AGENT = "Mozilla/5.0 (compatible; ContentIntelligence/1.0)"
+    
+    def __init__(self, timeout: float = 30, connect_timeout: float = 10,
+                 max_idle_per_host: int = 4, max_redirects: int = 5,
+                 drain_limit: int = 256 * 1024):
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.max_redirects = max_redirects
+        self.drain_limit = drain_limit
+        self.accept_encoding = "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate"
+        self.proxies = urllib.request.getproxies()
+        
+        self._idle: Dict[Tuple, List] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_settings(cls, settings: Dict) -> "HTTPClient":
+        """Build a client from the `settings` block of rss_feeds.json."""
+        http = settings.get("http", {})
+        return cls(
+            timeout=http.get("timeout_seconds", settings.get("fetch_timeout_seconds", 30)),
+            connect_timeout=http.get("connect_timeout_seconds", 10),
+            max_idle_per_host=http.get("max_idle_per_host", 4),
+            max_redirects=http.get("max_redirects", 5),
+        )
+    
+    def get(self, url: str, headers: Optional[Dict] = None,
+            timeout: Optional[float] = None) -> PooledResponse:
+        """GET a URL and return a streaming response (use as a context manager)."""
+        timeout = timeout or self.timeout
+        for _ in range(self.max_redirects + 1):
+            parts = urllib.parse.urlsplit(url)
+            key = (parts.scheme, parts.hostname, parts.port)
+            path = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+            proxy = self._proxy(parts.scheme, parts.hostname)
+            if proxy and parts.scheme == "http":
+                # Plain-http proxies take the absolute URL as the request target
+                path = urllib.parse.urlunsplit((parts.scheme, parts.netloc, parts.path or "/", parts.query, ""))
+            request_headers = {
+                "Host": parts.netloc,
+                "User-Agent": self.USER_AGENT,
+                "Accept-Encoding": self.accept_encoding,
+                "Connection": "keep-alive",
+                **(self._proxy_auth(proxy) if proxy and parts.scheme == "http" else {}),
+                **(headers or {}),
+            }
+            
+            conn, response = self._send(key, path, request_headers, timeout)
+            pooled = PooledResponse(self, key, conn, response, url)
+            
+            if response.status in self.REDIRECT_CODES and response.getheader("Location"):
+                pooled.close()
+                url = urllib.parse.urljoin(url, response.getheader("Location"))
+                continue
+            if not 200 <= response.status < 300:
+                pooled.close()
+                raise HTTPError(response.status, url)
+            return pooled
+        
+        raise HTTPError(310, url)  # too many redirects
+    
+    def _send(self, key: Tuple, path: str, headers: Dict, timeout: float):
+        conn, reused = self._acquire(key)
+        try:
+            conn.sock.settimeout(timeout)
+            conn.request("GET", path, headers=headers)
+            return conn, conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if not reused:
+                raise
+        except Exception:
+            conn.close()
+            raise
+        # The server dropped an idle keep-alive connection; retry once on a fresh one
+        conn = self._connect(key)
+        conn.sock.settimeout(timeout)
+        conn.request("GET", path, headers=headers)
+        return conn, conn.getresponse()
+    
+    def _acquire(self, key: Tuple) -> Tuple[object, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self._count(key, "requests", 1, locked=True)
+                self._count(key, "reused", 1, locked=True)
+                return idle.pop(), True
+        return self._connect(key), False
+    
+    def _proxy(self, scheme: str, host: Optional[str]) -> Optional[urllib.parse.SplitResult]:
+        """The proxy to use for this scheme/host, or None for a direct connection."""
+        proxy = self.proxies.get(scheme)
+        if not proxy or urllib.request.proxy_bypass(host or ""):
+            return None
+        return urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    
+    @staticmethod
+    def _proxy_auth(proxy: urllib.parse.SplitResult) -> Dict[str, str]:
+        if not proxy.username:
+            return {}
+        credentials = f"{urllib.parse.unquote(proxy.username)}:{urllib.parse.unquote(proxy.password or '')}"
+        return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode()).decode()}
+    
+    def _connect(self, key: Tuple):
+        scheme, host, port = key
+        conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        proxy = self._proxy(scheme, host)
+        if proxy is None:
+            conn = conn_class(host, port, timeout=self.connect_timeout)
+        else:
+            conn = conn_class(proxy.hostname, proxy.port or 8080, timeout=self.connect_timeout)
+            if scheme == "https":
+                conn.set_tunnel(host, port, headers=self._proxy_auth(proxy))
+        conn.connect()
+        conn.sock.settimeout(self.timeout)
+        self._count(key, "requests", 1)
+        self._count(key, "connections", 1)
+        return conn
+    
+    def _release(self, key: Tuple, conn, reusable: bool):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if reusable and len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+    
+    def _count(self, key: Tuple, field: str, amount: int, locked: bool = False):
+        host = key[1] or ""
+        if not locked:
+            with self._lock:
+                return self._count(key, field, amount, locked=True)
+        stats = self._stats.setdefault(host, {
+            "requests": 0, "connections": 0, "reused": 0, "bytes_wire": 0
+        })
+        stats[field] += amount
+    
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-host request, connection, reuse and transfer counters."""
+        with self._lock:
+            return {host: dict(s) for host, s in self._stats.items()}
+    
+    def log_stats(self):
+        """Print per-host connection reuse statistics."""
+        for host, s in sorted(self.stats().items(), key=lambda x: x[1]["requests"], reverse=True):
+            print(f"🔌 {host}: {s['requests']} requests over {s['connections']} connections "
+                  f"({s['reused']} reused), {s['bytes_wire'] // 1024} KB on the wire")
+    
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
 # ============================================================
 # RSS FEED FETCHER
 # ============================================================
 
+class StreamingFeedParser:
+    """
+    Incremental RSS 2.0 / Atom parser built on iterparse.
+    
+    Reads the feed element by element, extracts only title, description,
+    link and published date, drops stale entries before building them and
+    stops reading once `max_items` usable entries have been collected (or
+    `max_items` stale ones skipped, since feeds are newest-first).
+    """
+    
+    ENTRY_TAGS = {"item", "entry"}
+    DATE_TAGS = ("published", "pubDate", "date", "updated")
+    
+    def __init__(self, max_items: int, cutoff_time: Optional[datetime] = None):
+        self.max_items = max_items
+        self.cutoff_time = cutoff_time
+    
+    def parse(self, stream) -> List[Dict]:
+        """Parse entries from a binary stream; raises ET.ParseError on malformed XML."""
+        entries = []
+        skipped = 0
+        open_elements = []
+        for event, elem in ET.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                open_elements.append(elem)
+                continue
+            open_elements.pop()
+            if self._local(elem.tag) not in self.ENTRY_TAGS:
+                continue
+            
+            entry = self._parse_entry(elem)
+            if open_elements:
+                open_elements[-1].remove(elem)  # keep memory flat on long feeds
+            if entry is None:
+                skipped += 1
+                if skipped >= self.max_items:
+                    break
+                continue
+            
+            entries.append(entry)
+            if len(entries) >= self.max_items:
+                break
+        return entries
+    
+    def _parse_entry(self, elem) -> Optional[Dict]:
+        fields = {}
+        link = ""
+        for child in elem:
+            tag = self._local(child.tag)
+            if tag == "link":
+                # Atom: <link rel="alternate" href="..."/>, RSS: <link>url</link>
+                href = child.get("href")
+                if href and child.get("rel", "alternate") == "alternate" and not link:
+                    link = href
+                elif child.text and not link:
+                    link = child.text.strip()
+            elif tag not in fields:
+                fields[tag] = "".join(child.itertext()).strip()
+        
+        published = None
+        for tag in self.DATE_TAGS:
+            if fields.get(tag):
+                published = self._parse_date(fields[tag])
+                break
+        
+        # Skip old items before building anything else
+        if published and self.cutoff_time and published < self.cutoff_time:
+            return None
+        
+        return {
+            "title": fields.get("title", ""),
+            "description": fields.get("summary") or fields.get("description") or fields.get("content", ""),
+            "link": link,
+            "published": published,
+        }
+    
+    @staticmethod
+    def _local(tag) -> str:
+        return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+    
+    @staticmethod
+    def _parse_date(value: str) -> Optional[datetime]:
+        """Parse RFC 822 (RSS) or ISO 8601 (Atom) dates into naive UTC."""
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            try:
+                parsed = datetime.fromisoformat(value)
+            except ValueError:
+                return None
+        if parsed.tzinfo:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+
+
+class RecordingStream:
+    """Wraps a response and keeps the bytes read so far, for the feedparser fallback."""
+    
+    def __init__(self, raw):
+        self.raw = raw
+        self.buffer = bytearray()
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self.raw.read(size)
+        self.buffer.extend(data)
+        return data
+    
+    def read_all(self) -> bytes:
+        return bytes(self.buffer) + self.raw.read()
+
+
+class FeedReplayError(Exception):
+    """A feed fetch that failed while recording, or a URL missing from the bundle."""
+
+
+class FeedBundle:
+    """
+    Raw feed payloads of one scan, stored as a zip for offline replay.
+    
+    manifest.json holds the recording time, the feeds that were polled, the
+    trend counters as they were before scoring and, per URL, either the
+    payload file or the fetch error. Payloads are stored decompressed
+    (the zip deflates them) so replay parses exactly the bytes the scan saw.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, path: Path, manifest: Dict, archive: zipfile.ZipFile, recording: bool):
+        self.path = path
+        self.manifest = manifest
+        self.archive = archive
+        self.recording = recording
+    
+    @classmethod
+    def create(cls, path: Path, feeds: List[Dict], trends: Optional[Dict] = None) -> "FeedBundle":
+        path.parent.mkdir(parents=True, exist_ok=True)
+        manifest = {
+            "version": cls.VERSION,
+            "recorded_at": time.time(),
+            "feeds": feeds,
+            "trends": trends,
+            "payloads": {},
+        }
+        archive = zipfile.ZipFile(path.with_suffix(".tmp"), 'w', zipfile.ZIP_DEFLATED)
+        return cls(path, manifest, archive, recording=True)
+    
+    @classmethod
+    def open(cls, path: Path) -> "FeedBundle":
+        archive = zipfile.ZipFile(path, 'r')
+        manifest = json.loads(archive.read("manifest.json"))
+        if manifest.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported bundle version {manifest.get('version')} in {path}")
+        return cls(path, manifest, archive, recording=False)
+    
+    @property
+    def recorded_at(self) -> float:
+        return self.manifest["recorded_at"]
+    
+    @property
+    def feeds(self) -> List[Dict]:
+        return self.manifest["feeds"]
+    
+    def add(self, url: str, payload: bytes):
+        name = f"payloads/{len(self.manifest['payloads']):04d}.xml"
+        self.archive.writestr(name, payload)
+        self.manifest["payloads"][url] = {"file": name, "bytes": len(payload)}
+    
+    def add_error(self, url: str, error: Exception):
+        self.manifest["payloads"][url] = {"error": f"{type(error).__name__}: {error}"[:200]}
+    
+    def payload(self, url: str) -> bytes:
+        entry = self.manifest["payloads"].get(url)
+        if entry is None:
+            raise FeedReplayError(f"Not in recording: {url}")
+        if "error" in entry:
+            raise FeedReplayError(f"Recorded failure: {entry['error']}")
+        return self.archive.read(entry["file"])
+    
+    def close(self):
+        """Finish the bundle (recording: write the manifest and move it into place)."""
+        if self.recording:
+            self.archive.writestr("manifest.json", json.dumps(self.manifest, ensure_ascii=False))
+            self.archive.close()
+            os.replace(self.path.with_suffix(".tmp"), self.path)
+        else:
+            self.archive.close()
+
+
 class RSSFetcher:
     """Fetches and parses RSS feeds."""
     
-    def __init__(self, config_path: Path = CONFIG_DIR / "rss_feeds.json"):
+    def __init__(self, config_path: Path = CONFIG_DIR / "rss_feeds.json",
+                 http: Optional[HTTPClient] = None, health: Optional["FeedHealth"] = None,
+                 bundle: Optional[FeedBundle] = None, state_dir: Path = STATE_DIR):
         with open(config_path, 'r', encoding='utf-8') as f:
             self.config = json.load(f)
-        self.feeds = [f for f in self.config["feeds"] if f.get("enabled", True)]
+        self.feeds = [f for f in self.config["feeds"] if f.get("enabled", True) and f.get("url")]
         self.settings = self.config.get("settings", {})
+        self.http = http or HTTPClient.from_settings(self.settings)
+        self.failed_feeds = set()  # failed or circuit-open in the last fetch_all
+        
+        # Recording: payloads are also written to the bundle.
+        # Replaying: payloads come from the bundle and feed health is kept in memory only.
+        self.bundle = bundle
+        circuit_breaker = self.settings.get("circuit_breaker", {})
+        if health is None and self.replaying:
+            health = FeedHealth(state_path=None, **circuit_breaker)
+        self.health = health or FeedHealth(state_dir / "feed_health.json", **circuit_breaker)
     
-    def fetch_all(self) -> List[Dict]:
-        """Fetch all enabled RSS feeds and return combined items."""
-        if not HAS_FEEDPARSER:
-            print("❌ feedparser required. Install with: pip install feedparser")
-            return []
-        
+    @property
+    def replaying(self) -> bool:
+        return self.bundle is not None and not self.bundle.recording
+    
+    def fetch_all(self, feeds: Optional[List[Dict]] = None) -> List[Dict]:
+        """Fetch the given feeds (default: all enabled feeds) and return combined items."""
+        feeds = self.feeds if feeds is None else feeds
         all_items = []
+        self.failed_feeds = set()
         max_items = self.settings.get("max_items_per_feed", 20)
+        cutoff_time = self.cutoff_time()
+        
+        skipped = []
+        for feed_config in feeds:
+            name = feed_config["name"]
+            if not self.health.allow(name):
+                skipped.append(name)
+                self.failed_feeds.add(name)
+                continue
+            
+            probe = self.health.is_probe(name)
+            started = time.time()
+            try:
+                print(f"📡 Fetching: {name}{' (probe)' if probe else ''}...")
+                timeout = self.health.probe_timeout if probe else None
+                all_items.extend(self.fetch_items(feed_config, max_items, cutoff_time, timeout))
+                self.health.record_success(name, time.time() - started)
+            except Exception as e:
+                self.failed_feeds.add(name)
+                self.health.record_failure(name, e, time.time() - started)
+                print(f"⚠️  Error fetching {name}: {e}")
+        
+        self.health.save()
+        if skipped:
+            print(f"🩺 Skipped {len(skipped)} feeds with open circuits: {', '.join(skipped)}")
+        print(f"✅ Fetched {len(all_items)} items from {len(feeds) - len(skipped)} feeds")
+        self.http.log_stats()
+        return all_items
+    
+    def cutoff_time(self) -> datetime:
+        """Items published before this are skipped."""
         max_age = timedelta(hours=self.settings.get("max_age_hours", 48))
-        cutoff_time = datetime.now() - max_age
+        # Recordings keep their own clock so a replay keeps the same items
+        now = datetime.fromtimestamp(self.bundle.recorded_at) if self.bundle else datetime.now()
+        return now - max_age
+    
+    def fetch_items(self, feed_config: Dict, max_items: int, cutoff_time: Optional[datetime],
+                    timeout: Optional[float] = None) -> List[Dict]:
+        """Fetch one configured feed and turn its entries into scan items."""
+        items = []
+        for entry in self.fetch_feed(feed_config["url"], max_items, cutoff_time, timeout):
+            published = entry["published"]
+            item = {
+                "title": entry["title"],
+                "description": entry["description"],
+                "link": entry["link"],
+                "source": feed_config["name"],
+                "category": feed_config.get("category", "general"),
+                "published": published.isoformat() if published else None,
+                "priority": feed_config.get("priority", 2)
+            }
+            
+            # Generate unique ID
+            item["id"] = self.make_id(item["title"], item["link"])
+            
+            items.append(item)
+        return items
+    
+    def fetch_feed(self, url: str, max_items: int, cutoff_time: Optional[datetime],
+                   timeout: Optional[float] = None) -> List[Dict]:
+        """
+        Stream one feed through StreamingFeedParser, stopping after `max_items`
+        usable entries. Malformed feeds fall back to feedparser.
+        """
+        if self.replaying:
+            return self._parse(RecordingStream(io.BytesIO(self.bundle.payload(url))), max_items, cutoff_time)
+        
+        try:
+            response = self.http.get(url, timeout=timeout)
+        except Exception as e:
+            if self.bundle:
+                self.bundle.add_error(url, e)
+            raise
+        with response:
+            stream = RecordingStream(response)
+            try:
+                return self._parse(stream, max_items, cutoff_time)
+            finally:
+                # Malformed payloads are kept too, so replay hits the same fallback
+                if self.bundle:
+                    self.bundle.add(url, stream.read_all())
+    
+    def _parse(self, stream: RecordingStream, max_items: int,
+               cutoff_time: Optional[datetime]) -> List[Dict]:
+        try:
+            return StreamingFeedParser(max_items, cutoff_time).parse(stream)
+        except ET.ParseError:
+            if not HAS_FEEDPARSER:
+                raise
+            return self._parse_with_feedparser(stream.read_all(), max_items, cutoff_time)
+    
+    @staticmethod
+    def _parse_with_feedparser(payload: bytes, max_items: int,
+                               cutoff_time: Optional[datetime]) -> List[Dict]:
+        """Lenient fallback for feeds that are not well-formed XML."""
+        entries = []
+        skipped = 0
+        for entry in feedparser.parse(payload).entries:
+            # Parse published date
+            published = None
+            if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                published = datetime(*entry.published_parsed[:6])
+            
+            # Skip old items
+            if published and cutoff_time and published < cutoff_time:
+                skipped += 1
+                if skipped >= max_items:
+                    break
+                continue
+            
+            entries.append({
+                "title": entry.get("title", ""),
+                "description": entry.get("summary", entry.get("description", "")),
+                "link": entry.get("link", ""),
+                "published": published,
+            })
+            if len(entries) >= max_items:
+                break
+        return entries
+    
+    @staticmethod
+    def make_id(title: str, link: str) -> str:
+        """Stable short ID for an item, derived from its title and link."""
+        return hashlib.md5(f"{title}{link}".encode()).hexdigest()[:12]
+
+
+# ============================================================
+# FEED HEALTH (CIRCUIT BREAKER)
+# ============================================================
+
+class FeedHealth:
+    """
+    Persistent per-feed health with a circuit breaker.
+    
+    closed    -> feed is fetched normally
+    open      -> after `failure_threshold` consecutive failures the feed is
+                 skipped until its cooling-off period ends (doubling on
+                 every trip, capped at `max_cooldown_minutes`)
+    half_open -> once cooled off, a single probe with a short timeout
+                 decides whether the circuit closes or reopens
+    """
+    
+    def __init__(self, state_path: Optional[Path] = STATE_DIR / "feed_health.json",
+                 failure_threshold: int = 3, cooldown_minutes: float = 30,
+                 max_cooldown_minutes: float = 1440, probe_timeout_seconds: float = 10):
+        self.state_path = state_path
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown_minutes * 60
+        self.max_cooldown = max_cooldown_minutes * 60
+        self.probe_timeout = probe_timeout_seconds
+        self.feeds: Dict[str, Dict] = load_state(state_path, "feed health", "assuming all feeds healthy") or {}
+    
+    def save(self):
+        save_state(self.state_path, self.feeds, indent=2)
+    
+    def _state(self, name: str) -> Dict:
+        return self.feeds.setdefault(name, {
+            "state": "closed", "consecutive_failures": 0, "trips": 0,
+            "successes": 0, "failures": 0, "avg_latency_ms": None,
+            "last_error": None, "last_success": None, "last_failure": None, "open_until": None,
+        })
+    
+    def allow(self, name: str, now: Optional[float] = None) -> bool:
+        """Whether the feed may be fetched now; moves cooled-off circuits to half-open."""
+        now = now if now is not None else time.time()
+        state = self._state(name)
+        if state["state"] == "open":
+            if now < state["open_until"]:
+                return False
+            state["state"] = "half_open"
+        return True
+    
+    def is_probe(self, name: str) -> bool:
+        return self._state(name)["state"] == "half_open"
+    
+    def record_success(self, name: str, latency: float, now: Optional[float] = None):
+        state = self._state(name)
+        state.update(state="closed", consecutive_failures=0, trips=0, open_until=None,
+                     last_success=now if now is not None else time.time())
+        state["successes"] += 1
+        self._update_latency(state, latency)
+    
+    def record_failure(self, name: str, error: Exception, latency: float,
+                       now: Optional[float] = None):
+        now = now if now is not None else time.time()
+        state = self._state(name)
+        state["failures"] += 1
+        state["consecutive_failures"] += 1
+        state["last_failure"] = now
+        state["last_error"] = f"{type(error).__name__}: {error}"[:200]
+        self._update_latency(state, latency)
+        
+        if state["state"] == "half_open" or state["consecutive_failures"] >= self.failure_threshold:
+            state["trips"] += 1
+            cooldown = min(self.cooldown * 2 ** (state["trips"] - 1), self.max_cooldown)
+            state["state"] = "open"
+            state["open_until"] = now + cooldown
+    
+    @staticmethod
+    def _update_latency(state: Dict, latency: float):
+        latency_ms = latency * 1000
+        if state["avg_latency_ms"] is None:
+            state["avg_latency_ms"] = round(latency_ms)
+        else:
+            state["avg_latency_ms"] = round(0.7 * state["avg_latency_ms"] + 0.3 * latency_ms)
+    
+    def report(self, feeds: List[Dict]) -> str:
+        """Text table of health statistics for the configured feeds."""
+        icons = {"closed": "🟢", "half_open": "🟡", "open": "🔴"}
+        lines = [
+            "═" * 80,
+            "🩺 FEED HEALTH",
+            "═" * 80,
+        ]
+        for feed in feeds:
+            state = self.feeds.get(feed["name"])
+            if not state:
+                lines.append(f"⚪ {feed['name'][:40]:<40} never fetched")
+                continue
+            total = state["successes"] + state["failures"]
+            line = (f"{icons[state['state']]} {feed['name'][:40]:<40} "
+                    f"{state['successes']}/{total} ok  "
+                    f"{state['avg_latency_ms'] or 0:>6} ms avg")
+            if state["state"] == "open":
+                until = datetime.fromtimestamp(state["open_until"]).strftime('%Y-%m-%d %H:%M')
+                line += f"  skipped until {until}"
+            lines.append(line)
+            if state["consecutive_failures"] and state["last_error"]:
+                lines.append(f"   └ {state['consecutive_failures']} consecutive failures, "
+                             f"last: {state['last_error']}")
+        lines.append("═" * 80)
+        return "\n".join(lines)
+
+
+# ============================================================
+# FEED SCHEDULER
+# ============================================================
+
+class FeedScheduler:
+    """
+    Learns how often each feed publishes and how many HIGH_PRIORITY items it
+    yields, and polls every feed on its own interval.
+    
+    A feed's interval starts from a prior set by its `priority`, is pulled
+    towards the time it takes to publish `target_new_items` new items, is
+    shortened for feeds that keep producing high scorers, and backs off
+    geometrically while a feed has nothing new.
+    """
+    
+    def __init__(self, state_path: Optional[Path] = STATE_DIR / "feed_schedule.json",
+                 priority_intervals: Optional[Dict[str, float]] = None,
+                 min_interval_minutes: float = 10, max_interval_minutes: float = 720,
+                 target_new_items: int = 5, backoff: float = 1.5, smoothing: float = 0.3):
+        self.state_path = state_path
+        self.priority_intervals = priority_intervals or {"1": 15, "2": 30, "3": 60}
+        self.min_interval = min_interval_minutes
+        self.max_interval = max_interval_minutes
+        self.target_new_items = target_new_items
+        self.backoff = backoff
+        self.smoothing = smoothing
+        self.feeds: Dict[str, Dict] = load_state(state_path, "feed schedule", "polling all feeds") or {}
+    
+    def save(self):
+        save_state(self.state_path, self.feeds, indent=2)
+    
+    def due_feeds(self, feeds: List[Dict], now: Optional[float] = None) -> List[Dict]:
+        """Return the feeds whose next poll time has come (unknown feeds are always due)."""
+        now = now if now is not None else time.time()
+        return [f for f in feeds if self.feeds.get(f["name"], {}).get("next_poll", 0) <= now]
+    
+    def next_poll(self) -> Optional[float]:
+        """Earliest scheduled poll across all known feeds."""
+        times = [state["next_poll"] for state in self.feeds.values() if "next_poll" in state]
+        return min(times) if times else None
+    
+    def record_poll(self, feed_config: Dict, items: List[Dict], high_priority: int,
+                    now: Optional[float] = None):
+        """Update a feed's learned rate/yield after a successful poll and reschedule it."""
+        now = now if now is not None else time.time()
+        prior = float(self.priority_intervals.get(str(feed_config.get("priority", 2)), 30))
+        state = self.feeds.setdefault(feed_config["name"], {
+            "interval": prior, "rate_per_hour": None, "high_yield": 0.0, "polls": 0, "seen_ids": [],
+        })
+        
+        seen = set(state["seen_ids"])
+        new_items = [i for i in items if i["id"] not in seen]
+        
+        if "last_poll" in state:
+            hours = max((now - state["last_poll"]) / 3600, 1 / 60)
+            rate = len(new_items) / hours
+            if state["rate_per_hour"] is None:
+                state["rate_per_hour"] = rate
+            else:
+                state["rate_per_hour"] += self.smoothing * (rate - state["rate_per_hour"])
+        state["high_yield"] += self.smoothing * (high_priority - state["high_yield"])
+        state["polls"] += 1
         
-        for feed_config in self.feeds:
+        if new_items or state["rate_per_hour"] is None:
+            if state["rate_per_hour"]:
+                learned = self.target_new_items / state["rate_per_hour"] * 60
+            else:
+                learned = prior
+            # Trust what we learned more as evidence accumulates
+            weight = min(state["polls"], 5) / 5
+            interval = (1 - weight) * prior + weight * learned
+        else:
+            interval = state["interval"] * self.backoff
+        
+        if items and len(new_items) == len(items) and state["polls"] > 1:
+            # Everything was new, so items may have scrolled off unseen: poll sooner
+            interval = min(interval, state["interval"] / self.backoff)
+        
+        # Feeds that keep yielding high scorers get polled sooner
+        interval /= 1 + state["high_yield"]
+        interval = min(max(interval, self.min_interval), self.max_interval)
+        
+        state["interval"] = round(interval, 1)
+        state["last_poll"] = now
+        state["next_poll"] = now + interval * 60
+        state["seen_ids"] = [i["id"] for i in items][-100:]
+
+
+# ============================================================
+# TREND TRACKER
+# ============================================================
+
+class TrendTracker:
+    """
+    Sliding-window mention counter for entities/topics across scans.
+    
+    Mentions are counted in hourly buckets per keyword, so recording a hit
+    is a single dict increment. Buckets older than the baseline window
+    expire. A keyword is trending when its rate over the recent window is
+    `spike_ratio` times its baseline rate (with a floor, so brand-new
+    keywords can trend too).
+    """
+    
+    BUCKET_SECONDS = 3600
+    
+    def __init__(self, state_path: Optional[Path] = STATE_DIR / "trends.json",
+                 recent_hours: int = 6, baseline_hours: int = 168,
+                 spike_ratio: float = 3.0, min_mentions: int = 3,
+                 baseline_floor_per_day: float = 1.0, warmup_hours: int = 12):
+        self.state_path = state_path
+        self.recent_hours = recent_hours
+        self.baseline_hours = baseline_hours
+        self.spike_ratio = spike_ratio
+        self.min_mentions = min_mentions
+        self.baseline_floor = baseline_floor_per_day / 24
+        self.warmup_hours = warmup_hours
+        self.clock = time.time  # replays pin this to the recording time
+        
+        self.started = time.time()
+        self.buckets: Dict[str, Dict[int, int]] = {}  # keyword -> {hour: count}
+        self.seen: Dict[str, int] = {}  # item id -> hour first counted
+        
+        self.load()
+    
+    def load(self):
+        """Load counters saved by a previous run."""
+        state = load_state(self.state_path, "trend state")
+        if state:
+            self.restore(state)
+    
+    def restore(self, state: Dict):
+        """Replace the counters with a snapshot() taken earlier."""
+        self.started = state.get("started", self.started)
+        self.buckets = {
+            key: {int(hour): count for hour, count in hours.items()}
+            for key, hours in state.get("buckets", {}).items()
+        }
+        self.seen = dict(state.get("seen", {}))
+    
+    def snapshot(self) -> Dict:
+        return {
+            "started": self.started,
+            "buckets": self.buckets,
+            "seen": self.seen,
+        }
+    
+    def save(self):
+        """Expire old buckets and persist counters for the next run."""
+        if not self.state_path:
+            return
+        self._expire(self._hour())
+        save_state(self.state_path, self.snapshot())
+    
+    def record(self, item_id: str, keywords: List[str], now: Optional[float] = None):
+        """Count one mention per keyword for an item (once per item ID)."""
+        if item_id in self.seen:
+            return
+        hour = self._hour(now)
+        self.seen[item_id] = hour
+        
+        for key in set(keywords):
+            hours = self.buckets.setdefault(key, {})
+            hours[hour] = hours.get(hour, 0) + 1
+    
+    def trending_keywords(self, now: Optional[float] = None) -> Dict[str, float]:
+        """Return {keyword: spike ratio} for keywords whose mention rate is spiking."""
+        now = now if now is not None else self.clock()
+        observed_hours = (now - self.started) / 3600
+        if observed_hours < self.warmup_hours:
+            return {}
+        
+        hour = self._hour(now)
+        recent_start = hour - self.recent_hours + 1
+        baseline_start = hour - self.baseline_hours + 1
+        # Only divide by hours we were actually watching
+        baseline_span = min(self.baseline_hours - self.recent_hours,
+                            max(observed_hours - self.recent_hours, 1))
+        
+        trending = {}
+        for key, hours in self.buckets.items():
+            recent = baseline = 0
+            for h, count in hours.items():
+                if h >= recent_start:
+                    recent += count
+                elif h >= baseline_start:
+                    baseline += count
+            if recent < self.min_mentions:
+                continue
+            
+            recent_rate = recent / self.recent_hours
+            baseline_rate = max(baseline / baseline_span, self.baseline_floor)
+            ratio = recent_rate / baseline_rate
+            if ratio >= self.spike_ratio:
+                trending[key] = round(ratio, 1)
+        return trending
+    
+    def _hour(self, now: Optional[float] = None) -> int:
+        return int((now if now is not None else self.clock()) // self.BUCKET_SECONDS)
+    
+    def _expire(self, hour: int):
+        oldest = hour - self.baseline_hours + 1
+        for key in list(self.buckets):
+            hours = {h: c for h, c in self.buckets[key].items() if h >= oldest}
+            if hours:
+                self.buckets[key] = hours
+            else:
+                del self.buckets[key]
+        self.seen = {i: h for i, h in self.seen.items() if h >= oldest}
+
+
+# ============================================================
+# COMPETITOR COVERAGE INDEX
+# ============================================================
+
+ARABIC_DIACRITICS = re.compile(r'[\u0610-\u061A\u064B-\u065F\u0670\u06D6-\u06ED\u0640]')
+ARABIC_LETTER_MAP = str.maketrans({"أ": "ا", "إ": "ا", "آ": "ا", "ى": "ي", "ة": "ه", "ؤ": "و", "ئ": "ي"})
+TITLE_STOPWORDS = {
+    "the", "a", "an", "of", "to", "in", "on", "for", "and", "or", "is", "are", "with", "by", "at",
+    "في", "من", "على", "الى", "عن", "ان", "مع", "هذا", "هذه", "هل", "ما", "لا", "و", "دي", "ده",
+}
+
+
+def normalize_words(text: str) -> List[str]:
+    """Lowercase, strip Arabic diacritics/letter variants and punctuation, drop stopwords."""
+    text = ARABIC_DIACRITICS.sub('', text.lower()).translate(ARABIC_LETTER_MAP)
+    return [w for w in re.findall(r'\w+', text) if w not in TITLE_STOPWORDS and len(w) > 1]
+
+
+class CompetitorIndex:
+    """
+    Hashed title-shingle index of videos our audience already watches.
+    
+    Every competitor title is reduced to word-bigram shingles; each shingle
+    hash maps to the videos containing it. Looking a story up costs one dict
+    probe per shingle of its title, independent of how many videos are indexed.
+    """
+    
+    def __init__(self, min_overlap: float = 0.5, min_shared: int = 2):
+        self.min_overlap = min_overlap
+        self.min_shared = min_shared
+        self.videos: List[Dict] = []
+        self.shingle_counts: List[int] = []
+        self.index: Dict[int, List[int]] = {}  # shingle hash -> video positions
+        self.channels: List[Dict] = []
+    
+    @classmethod
+    def from_config(cls, config: Dict, base_dir: Path = BASE_DIR) -> "CompetitorIndex":
+        """Build the index from the `competitor_coverage` block of a Channel DNA."""
+        index = cls(config.get("min_overlap", 0.5), config.get("min_shared", 2))
+        if config.get("audience_videos"):
+            index.load_videos_csv(base_dir / config["audience_videos"])
+        if config.get("also_watch_channels"):
+            index.load_channels_csv(base_dir / config["also_watch_channels"])
+        return index
+    
+    @staticmethod
+    def shingles(title: str) -> set:
+        words = normalize_words(title)
+        if len(words) < 2:
+            return {zlib.crc32(w.encode()) for w in words}
+        return {zlib.crc32(f"{a} {b}".encode()) for a, b in zip(words, words[1:])}
+    
+    def add(self, title: str, url: str = "", channel: str = "", published: str = ""):
+        """Index a single competitor video."""
+        shingles = self.shingles(title)
+        if not shingles:
+            return
+        position = len(self.videos)
+        self.videos.append({"title": title, "url": url, "channel": channel, "published": published})
+        self.shingle_counts.append(len(shingles))
+        for shingle in shingles:
+            self.index.setdefault(shingle, []).append(position)
+    
+    def load_videos_csv(self, path: Path):
+        """Index the 'audience also watches' videos export."""
+        try:
+            with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+                for row in csv.DictReader(f):
+                    self.add(row.get("Title", ""), row.get("URL", ""),
+                             row.get("Creator Name", "").strip(), row.get("Upload Date", ""))
+        except OSError as e:
+            print(f"⚠️  Could not load competitor videos from {path}: {e}")
+    
+    def load_channels_csv(self, path: Path):
+        """Remember the 'audience also watches' channels, ordered by relevance."""
+        try:
+            with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+                rows = list(csv.DictReader(f))
+        except OSError as e:
+            print(f"⚠️  Could not load competitor channels from {path}: {e}")
+            return
+        
+        for row in rows:
+            match = re.search(r'channel/(UC[\w-]+)', row.get("YouTube URL", ""))
+            if match:
+                self.channels.append({
+                    "name": row.get("Name", "").strip(),
+                    "channel_id": match.group(1),
+                    "relevance": float(row.get("Relevance Score") or 0),
+                })
+        self.channels.sort(key=lambda c: c["relevance"], reverse=True)
+    
+    def lookup(self, title: str) -> Optional[Dict]:
+        """Return the competitor video that best covers this title, if any."""
+        shingles = self.shingles(title)
+        if not shingles:
+            return None
+        
+        shared: Dict[int, int] = {}
+        for shingle in shingles:
+            for position in self.index.get(shingle, ()):
+                shared[position] = shared.get(position, 0) + 1
+        if not shared:
+            return None
+        
+        best, best_overlap = None, 0.0
+        for position, count in shared.items():
+            if count < self.min_shared:
+                continue
+            overlap = count / min(len(shingles), self.shingle_counts[position])
+            if overlap > best_overlap:
+                best, best_overlap = position, overlap
+        
+        if best is None or best_overlap < self.min_overlap:
+            return None
+        return {**self.videos[best], "overlap": round(best_overlap, 2)}
+
+
+class CompetitorUploads:
+    """
+    Latest uploads of the competitor channels the profiles follow.
+    
+    Each channel's uploads feed is fetched at most once per scan, however
+    many profiles list it, and through the feed circuit breaker. A channel
+    that fails or is skipped keeps the uploads of its last good fetch. The
+    uploads are kept in the state dir so the scoring service indexes the
+    same videos as the last scan.
+    """
+    
+    YOUTUBE_FEED_URL = "https://www.youtube.com/feeds/videos.xml?channel_id={}"
+    
+    def __init__(self, state_path: Optional[Path] = STATE_DIR / "competitor_uploads.json"):
+        self.state_path = state_path
+        # channel_id -> {"name", "fetched_at", "videos": [{"title", "url", "channel", "published"}]}
+        self.channels: Dict[str, Dict] = load_state(state_path, "competitor uploads") or {}
+    
+    def save(self):
+        save_state(self.state_path, self.channels)
+    
+    def snapshot(self) -> Dict:
+        return self.channels
+    
+    def restore(self, state: Dict):
+        """Replace the uploads with a snapshot() taken earlier."""
+        self.channels = state
+    
+    def fetch(self, channels: List[Dict], fetcher: "RSSFetcher"):
+        """Fetch the uploads of the given channels (deduplicated by channel_id)."""
+        health = fetcher.health
+        skipped = []
+        for channel_id, channel in {c["channel_id"]: c for c in channels}.items():
+            name = f"YouTube: {channel['name']}"
+            if not health.allow(name):
+                skipped.append(channel["name"])
+                continue
+            probe = health.is_probe(name)
+            started = time.time()
             try:
-                print(f"📡 Fetching: {feed_config['name']}...")
-                feed = feedparser.parse(feed_config["url"])
-                
-                for entry in feed.entries[:max_items]:
-                    # Parse published date
-                    published = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        published = datetime(*entry.published_parsed[:6])
-                    
-                    # Skip old items
-                    if published and published < cutoff_time:
-                        continue
-                    
-                    item = {
-                        "title": entry.get("title", ""),
-                        "description": entry.get("summary", entry.get("description", "")),
-                        "link": entry.get("link", ""),
-                        "source": feed_config["name"],
-                        "category": feed_config.get("category", "general"),
-                        "published": published.isoformat() if published else None,
-                        "priority": feed_config.get("priority", 2)
-                    }
-                    
-                    # Generate unique ID
-                    item["id"] = hashlib.md5(
-                        f"{item['title']}{item['link']}".encode()
-                    ).hexdigest()[:12]
-                    
-                    all_items.append(item)
-                    
+                entries = fetcher.fetch_feed(self.YOUTUBE_FEED_URL.format(channel_id), max_items=50,
+                                             cutoff_time=None, timeout=health.probe_timeout if probe else None)
+                health.record_success(name, time.time() - started)
             except Exception as e:
-                print(f"⚠️  Error fetching {feed_config['name']}: {e}")
-        
-        print(f"✅ Fetched {len(all_items)} items from {len(self.feeds)} feeds")
-        return all_items
+                health.record_failure(name, e, time.time() - started)
+                print(f"⚠️  Error fetching competitor {channel['name']}: {e}")
+                continue
+            self.channels[channel_id] = {
+                "name": channel["name"],
+                "fetched_at": time.time(),
+                "videos": [
+                    {"title": entry["title"], "url": entry["link"], "channel": channel["name"],
+                     "published": entry["published"].isoformat() if entry["published"] else ""}
+                    for entry in entries
+                ],
+            }
+        health.save()
+        if skipped:
+            print(f"🩺 Skipped {len(skipped)} competitor channels with open circuits: {', '.join(skipped)}")
+    
+    def videos(self, channels: List[Dict]) -> List[Dict]:
+        """Known uploads of the given channels, in channel order."""
+        return [video for channel in channels
+                for video in self.channels.get(channel["channel_id"], {}).get("videos", [])]
+
+
+# ============================================================
+# KEYWORD MATCHER
+# ============================================================
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over the keywords of one or more DNA profiles.
+    
+    Finds every keyword that occurs as a substring of the text (the same
+    semantics as `keyword.lower() in content`) in a single pass, however
+    many keywords or profiles are registered.
+    """
+    
+    def __init__(self):
+        # pattern -> [(profile_id, category, position in category list, keyword)]
+        self.owners: Dict[str, List[Tuple]] = {}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[str]] = [[]]
+        self._built = True
+    
+    @classmethod
+    def shared_by(cls, scorers: List["ContentScorer"]) -> "KeywordMatcher":
+        """One matcher for all scorers, each registered as its own profile."""
+        matcher = cls()
+        for profile_id, scorer in enumerate(scorers):
+            scorer.profile_id = profile_id
+            scorer.matcher = matcher
+            matcher.add_profile(profile_id, scorer.keyword_categories())
+        return matcher
+    
+    def add_profile(self, profile_id, categories: Dict[str, List[str]]):
+        for category, keywords in categories.items():
+            for position, keyword in enumerate(keywords):
+                pattern = keyword.lower()
+                if pattern:
+                    self.owners.setdefault(pattern, []).append((profile_id, category, position, keyword))
+        self._built = False
+    
+    def _build(self):
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[str]] = [[]]
+        for pattern in self.owners:
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(pattern)
+        
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+        
+        self._goto, self._fail, self._out = goto, fail, out
+        self._built = True
+    
+    def find(self, text: str) -> set:
+        """Return the set of registered patterns occurring in (lowercased) text."""
+        if not self._built:
+            self._build()
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+    
+    def hits(self, text: str) -> Dict[int, Dict[str, List[str]]]:
+        """Matched keywords as {profile_id: {category: [keywords in DNA order]}}."""
+        owners = []
+        for pattern in self.find(text):
+            owners.extend(self.owners[pattern])
+        owners.sort(key=lambda owner: owner[2])
+        
+        hits: Dict[int, Dict[str, List[str]]] = {}
+        for profile_id, category, _, keyword in owners:
+            hits.setdefault(profile_id, {}).setdefault(category, []).append(keyword)
+        return hits
 
 
 # ============================================================
@@ -159,49 +1386,126 @@ class RSSFetcher:
 class ContentScorer:
     """Scores RSS items against Channel DNA."""
     
-    def __init__(self, dna: ChannelDNA):
+    THREAT_WORDS = ["خطر", "تهديد", "threat", "danger", "warning", "crisis",
+                    "انهيار", "collapse", "crash", "destroy", "devastating"]
+    REVEAL_WORDS = ["سر", "خفي", "secret", "hidden", "revealed", "exposed",
+                    "truth", "actually", "really", "uncovered"]
+    STAKES_WORDS = ["خسر", "فقد", "lost", "lose", "losing", "cost",
+                    "billion", "trillion", "مليار", "تريليون"]
+    NUMBER_PATTERN = re.compile(
+        r'\d+(?:,\d+)*(?:\.\d+)?(?:\s*(?:مليار|مليون|billion|million|trillion|percent|%))?'
+    )
+    
+    def __init__(self, dna: ChannelDNA, trend_tracker: Optional[TrendTracker] = None,
+                 competitor_index: Optional[CompetitorIndex] = None,
+                 matcher: Optional[KeywordMatcher] = None, profile_id: int = 0):
         self.dna = dna
+        self.trend_tracker = trend_tracker
+        self.competitor_index = competitor_index
+        self.trending: Dict[str, float] = {}
+        self.profile_id = profile_id
+        
+        if matcher is None:
+            matcher = KeywordMatcher()
+            matcher.add_profile(profile_id, self.keyword_categories())
+        self.matcher = matcher
+    
+    def keyword_categories(self) -> Dict[str, List[str]]:
+        """Every keyword list this scorer matches, by category."""
+        return {
+            "negative": self.dna.negative_keywords,
+            "entities": self.dna.positive_keywords.get("entities", []),
+            "regions": self.dna.positive_keywords.get("regions", []),
+            "topics": self.dna.positive_keywords.get("topics", []),
+            "threat": self.THREAT_WORDS,
+            "reveal": self.REVEAL_WORDS,
+            "stakes": self.STAKES_WORDS,
+        }
     
-    def score_item(self, item: Dict) -> Dict:
+    def analyze(self, item: Dict) -> Dict:
+        """Tokenize an item once: keyword hits for every profile in the matcher, plus numbers."""
+        title = item.get("title", "").lower()
+        description = item.get("description", "").lower()
+        content = f"{title} {description}"
+        analysis = {
+            "hits": self.matcher.hits(content),
+            "numbers": len(self.NUMBER_PATTERN.findall(content)),
+        }
+        # Article text (see ArticleEnricher) is matched on its own: any long
+        # article is full of numbers, hook words and substrings of short
+        # keywords, so score_item only takes capped positive hits from it, and
+        # Latin keywords must be whole words ("AI" is not in "said")
+        body = item.get("body", "").lower()
+        if body:
+            body_hits = self.matcher.hits(body)
+            for categories in body_hits.values():
+                for category, keywords in categories.items():
+                    categories[category] = [
+                        kw for kw in keywords
+                        if not kw.isascii() or re.search(rf"(?<!\w){re.escape(kw.lower())}(?!\w)", body)
+                    ]
+            analysis["body_hits"] = body_hits
+        return analysis
+    
+    @staticmethod
+    def trend_keywords(analysis: Dict) -> List[str]:
+        """Entity/topic keywords of an analyzed item, across every profile, as TrendTracker counts them."""
+        keywords = set()
+        for hits in analysis["hits"].values():
+            keywords.update(kw.lower() for kw in hits.get("entities", []) + hits.get("topics", []))
+        return sorted(keywords)
+    
+    def update_trends(self, items: List[Dict], analyses: Optional[List[Dict]] = None,
+                      keywords: Optional[Dict[str, List[str]]] = None):
+        """
+        Record entity/topic mentions and refresh the trending snapshot.
+        `keywords` ({item id: trend_keywords()}) skips the analysis when it
+        was already done elsewhere, e.g. by scan workers.
+        """
+        if not self.trend_tracker:
+            return
+        if keywords is None:
+            analyses = analyses or [self.analyze(item) for item in items]
+            keywords = {}
+            for item, analysis in zip(items, analyses):
+                item_id = item.get("id") or RSSFetcher.make_id(item.get("title", ""), item.get("link", ""))
+                keywords[item_id] = self.trend_keywords(analysis)
+        for item_id, item_keywords in keywords.items():
+            self.trend_tracker.record(item_id, item_keywords)
+        self.trending = self.trend_tracker.trending_keywords()
+    
+    def score_item(self, item: Dict, analysis: Optional[Dict] = None) -> Dict:
         """Score a single item against Channel DNA."""
         score = 50  # Base score
         reasons = []
         flags = []
         
-        title = item.get("title", "").lower()
-        description = item.get("description", "").lower()
-        content = f"{title} {description}"
+        analysis = analysis or self.analyze(item)
+        hits = analysis["hits"].get(self.profile_id, {})
         
         # ===== NEGATIVE KEYWORDS (Instant Reject) =====
-        for keyword in self.dna.negative_keywords:
-            if keyword.lower() in content:
-                return {
-                    "score": 0,
-                    "status": "REJECT",
-                    "hook_potential": None,
-                    "reasons": [f"❌ Reject keyword: '{keyword}'"],
-                    "flags": ["AUTO_REJECT"],
-                    "item": item
-                }
+        if hits.get("negative"):
+            return {
+                "score": 0,
+                "status": "REJECT",
+                "hook_potential": None,
+                "reasons": [f"❌ Reject keyword: '{hits['negative'][0]}'"],
+                "flags": ["AUTO_REJECT"],
+                "item": item
+            }
         
         # ===== POSITIVE KEYWORDS =====
         weights = self.dna.scoring_weights
         
         # Entity keywords (Trump, Tesla, etc.)
-        entity_hits = []
-        for kw in self.dna.positive_keywords.get("entities", []):
-            if kw.lower() in content:
-                entity_hits.append(kw)
+        entity_hits = hits.get("entities", [])
         if entity_hits:
             bonus = len(entity_hits) * weights.get("positive_keyword_entity", 5)
             score += bonus
             reasons.append(f"🏢 Entities: {', '.join(entity_hits[:3])} (+{bonus})")
         
         # Regional keywords (Saudi, Dubai, etc.)
-        region_hits = []
-        for kw in self.dna.positive_keywords.get("regions", []):
-            if kw.lower() in content:
-                region_hits.append(kw)
+        region_hits = hits.get("regions", [])
         if region_hits:
             bonus = weights.get("positive_keyword_region", 15)
             score += bonus
@@ -209,77 +1513,88 @@ class ContentScorer:
             flags.append("REGIONAL_RELEVANCE")
         
         # Topic keywords
-        topic_hits = []
-        for kw in self.dna.positive_keywords.get("topics", []):
-            if kw.lower() in content:
-                topic_hits.append(kw)
+        topic_hits = hits.get("topics", [])
         if topic_hits:
             bonus = len(topic_hits) * weights.get("positive_keyword_topic", 3)
             score += min(bonus, 15)  # Cap at 15
             reasons.append(f"📌 Topics: {', '.join(topic_hits[:3])} (+{min(bonus, 15)})")
         
+        # Article text: only entities/regions/topics the summary missed, capped
+        body_hits = analysis.get("body_hits", {}).get(self.profile_id, {})
+        if body_hits:
+            new_entities = [kw for kw in body_hits.get("entities", []) if kw not in entity_hits]
+            new_topics = [kw for kw in body_hits.get("topics", []) if kw not in topic_hits]
+            new_regions = [] if region_hits else body_hits.get("regions", [])[:1]
+            bonus = min(
+                len(new_entities) * weights.get("positive_keyword_entity", 5)
+                + len(new_topics) * weights.get("positive_keyword_topic", 3)
+                + len(new_regions) * weights.get("positive_keyword_region", 15),
+                weights.get("full_text_keyword_cap", 10),
+            )
+            if bonus:
+                score += bonus
+                found = new_regions + new_entities + new_topics
+                reasons.append(f"📄 Article text: {', '.join(found[:3])} (+{bonus})")
+        
         # ===== SPECIFICITY (Numbers) =====
-        numbers = re.findall(
-            r'\d+(?:,\d+)*(?:\.\d+)?(?:\s*(?:مليار|مليون|billion|million|trillion|percent|%))?',
-            content
-        )
-        if len(numbers) >= 2:
+        numbers = analysis["numbers"]
+        if numbers >= 2:
             bonus = weights.get("specific_numbers", 15)
             score += bonus
-            reasons.append(f"🔢 Specific numbers: {len(numbers)} found (+{bonus})")
+            reasons.append(f"🔢 Specific numbers: {numbers} found (+{bonus})")
             flags.append("HAS_NUMBERS")
-        elif len(numbers) == 1:
+        elif numbers == 1:
             score += 8
             reasons.append(f"🔢 Has 1 number (+8)")
         
         # ===== HOOK POTENTIAL DETECTION =====
         hook_potential = "news_peg"  # Default
         
-        # Threat angle
-        threat_words = ["خطر", "تهديد", "threat", "danger", "warning", "crisis", 
-                       "انهيار", "collapse", "crash", "destroy", "devastating"]
-        for word in threat_words:
-            if word.lower() in content:
-                hook_potential = "threat_claim"
-                bonus = weights.get("threat_angle", 10)
+        # Threat angle, then reveal, then stakes: first matching word wins
+        for category, hook, weight_key, default, icon, label, flag in (
+            ("threat", "threat_claim", "threat_angle", 10, "⚠️", "Threat angle", "THREAT_ANGLE"),
+            ("reveal", "reveal", "reveal_angle", 8, "🔍", "Reveal angle", "REVEAL_ANGLE"),
+            ("stakes", "stakes", "stakes_angle", 6, "💰", "Stakes angle", "STAKES_ANGLE"),
+        ):
+            if hits.get(category):
+                hook_potential = hook
+                bonus = weights.get(weight_key, default)
                 score += bonus
-                reasons.append(f"⚠️ Threat angle: '{word}' (+{bonus})")
-                flags.append("THREAT_ANGLE")
+                reasons.append(f"{icon} {label}: '{hits[category][0]}' (+{bonus})")
+                flags.append(flag)
                 break
         
-        # Reveal angle
-        if hook_potential == "news_peg":
-            reveal_words = ["سر", "خفي", "secret", "hidden", "revealed", "exposed",
-                          "truth", "actually", "really", "uncovered"]
-            for word in reveal_words:
-                if word.lower() in content:
-                    hook_potential = "reveal"
-                    bonus = weights.get("reveal_angle", 8)
-                    score += bonus
-                    reasons.append(f"🔍 Reveal angle: '{word}' (+{bonus})")
-                    flags.append("REVEAL_ANGLE")
-                    break
-        
-        # Stakes/Loss angle
-        if hook_potential == "news_peg":
-            stakes_words = ["خسر", "فقد", "lost", "lose", "losing", "cost",
-                          "billion", "trillion", "مليار", "تريليون"]
-            for word in stakes_words:
-                if word.lower() in content:
-                    hook_potential = "stakes"
-                    bonus = weights.get("stakes_angle", 6)
-                    score += bonus
-                    reasons.append(f"💰 Stakes angle: '{word}' (+{bonus})")
-                    flags.append("STAKES_ANGLE")
-                    break
+        # ===== TRENDING =====
+        trending_hits = [kw for kw in entity_hits + topic_hits if kw.lower() in self.trending]
+        if trending_hits:
+            bonus = weights.get("trending_bonus", 20)
+            score += bonus
+            spikes = ', '.join(f"{kw} x{self.trending[kw.lower()]}" for kw in trending_hits[:2])
+            reasons.append(f"📈 Trending: {spikes} (+{bonus})")
+            flags.append("TRENDING")
+        
+        # ===== COMPETITOR COVERAGE =====
+        if self.competitor_index:
+            covered = self.competitor_index.lookup(item.get("title", ""))
+            if covered:
+                penalty = weights.get("competitor_covered_penalty", -15)
+                score += penalty
+                reasons.append(
+                    f"👥 Covered by {covered['channel']}: \"{covered['title'][:60]}\" "
+                    f"{covered['url']} ({penalty})"
+                )
+                flags.append("COMPETITOR_COVERED")
         
         # ===== FINAL ADJUSTMENTS =====
+        if item.get("body"):
+            flags.append("FULL_TEXT")
+        
         # Priority bonus (from feed config)
         if item.get("priority") == 1:
             score += 5
         
-        # Cap score at 100
-        score = min(score, 100)
+        # Keep score within 0-100
+        score = max(min(score, 100), 0)
         
         # Determine status
         if score >= 75:
@@ -303,13 +1618,19 @@ class ContentScorer:
     
     def score_batch(self, items: List[Dict]) -> List[Dict]:
         """Score a batch of items and return sorted results."""
-        scored = [self.score_item(item) for item in items]
-        
+        analyses = [self.analyze(item) for item in items]
+        self.update_trends(items, analyses)
+        scored = [self.score_item(item, analysis) for item, analysis in zip(items, analyses)]
+        return self.rank(scored)
+    
+    @staticmethod
+    def rank(scored: List[Dict]) -> List[Dict]:
+        """Drop duplicate titles and sort by score."""
         # Remove duplicates (by title similarity)
         seen_titles = set()
         unique_scored = []
         for s in scored:
-            title_key = s["item"]["title"][:50].lower()
+            title_key = s["item"].get("title", "")[:50].lower()
             if title_key not in seen_titles:
                 seen_titles.add(title_key)
                 unique_scored.append(s)
@@ -320,6 +1641,233 @@ class ContentScorer:
         return unique_scored
 
 
+class MultiChannelScorer:
+    """
+    Scores one item stream for several Channel DNA profiles in a single pass.
+    
+    All profiles share one KeywordMatcher built from the union of their
+    keywords, so each item is tokenized and scanned once; the per-profile
+    work is only applying that profile's weights to the hits it owns.
+    """
+    
+    def __init__(self, scorers: List[ContentScorer]):
+        self.scorers = scorers
+        self.matcher = KeywordMatcher.shared_by(scorers)
+    
+    def score_batch(self, items: List[Dict]) -> List[List[Dict]]:
+        """Return ranked results for every profile, in the order the scorers were given."""
+        lead = self.scorers[0]
+        analyses = [lead.analyze(item) for item in items]
+        
+        # Mentions are counted once per item across all profiles
+        lead.update_trends(items, analyses)
+        for scorer in self.scorers[1:]:
+            scorer.trending = lead.trending
+        
+        return [
+            scorer.rank([scorer.score_item(item, a) for item, a in zip(items, analyses)])
+            for scorer in self.scorers
+        ]
+
+
+# ============================================================
+# ARTICLE ENRICHMENT
+# ============================================================
+
+class ArticleTextExtractor(HTMLParser):
+    """Collects paragraph text from an article page, preferring <article> content."""
+    
+    SKIP_TAGS = {"script", "style", "noscript", "nav", "header", "footer", "aside", "form", "figure"}
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.skip_depth = 0
+        self.article_depth = 0
+        self.paragraph: Optional[List[str]] = None
+        self.paragraph_in_article = False
+        self.article_paragraphs: List[str] = []
+        self.page_paragraphs: List[str] = []
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag == "article":
+            self.article_depth += 1
+        elif tag == "p" and not self.skip_depth:
+            self._end_paragraph()
+            self.paragraph = []
+            self.paragraph_in_article = self.article_depth > 0
+    
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS:
+            self.skip_depth = max(self.skip_depth - 1, 0)
+        elif tag == "article":
+            self._end_paragraph()
+            self.article_depth = max(self.article_depth - 1, 0)
+        elif tag == "p":
+            self._end_paragraph()
+    
+    def handle_data(self, data):
+        if self.paragraph is not None and not self.skip_depth:
+            self.paragraph.append(data)
+    
+    def _end_paragraph(self):
+        if self.paragraph is None:
+            return
+        text = " ".join("".join(self.paragraph).split())
+        self.paragraph = None
+        if len(text) < 40:  # bylines, captions, "Read more" links
+            return
+        self.page_paragraphs.append(text)
+        if self.paragraph_in_article:
+            self.article_paragraphs.append(text)
+    
+    @classmethod
+    def extract(cls, html: str) -> str:
+        parser = cls()
+        parser.feed(html)
+        parser.close()
+        parser._end_paragraph()
+        return "\n".join(parser.article_paragraphs or parser.page_paragraphs)
+
+
+class ArticleEnricher:
+    """
+    Fetches full article text for borderline items so they can be re-scored.
+    
+    Only items scoring in [min_score, max_score) are worth the extra request:
+    clear winners and clear misses would not change status. Fetches run on a
+    small thread pool through the shared HTTPClient, with at most
+    `per_domain` concurrent requests and `domain_interval_seconds` between
+    request starts per site. Extracted text is cached on disk by item ID.
+    """
+    
+    def __init__(self, http: HTTPClient, cache_path: Optional[Path] = STATE_DIR / "article_cache.json",
+                 min_score: int = 50, max_score: int = 75, max_items: int = 30,
+                 max_workers: int = 8, per_domain: int = 2, domain_interval_seconds: float = 1.0,
+                 timeout_seconds: float = 15, max_bytes: int = 1024 * 1024, max_chars: int = 4000,
+                 cache_days: float = 14, retry_failed_hours: float = 6):
+        self.http = http
+        self.cache_path = cache_path
+        self.min_score = min_score
+        self.max_score = max_score
+        self.max_items = max_items
+        self.max_workers = max_workers
+        self.per_domain = per_domain
+        self.domain_interval = domain_interval_seconds
+        self.timeout = timeout_seconds
+        self.max_bytes = max_bytes
+        self.max_chars = max_chars
+        self.cache_ttl = cache_days * 86400
+        self.retry_failed_after = retry_failed_hours * 3600
+        
+        # item id -> {"text", "fetched", "error"}
+        self.cache: Dict[str, Dict] = load_state(cache_path, "article cache") or {}
+        self._domains: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+    
+    def save(self):
+        """Drop expired entries and persist the cache."""
+        if not self.cache_path:
+            return
+        oldest = time.time() - self.cache_ttl
+        self.cache = {i: e for i, e in self.cache.items() if e["fetched"] >= oldest}
+        save_state(self.cache_path, self.cache)
+    
+    def candidates(self, results: List[List[Dict]]) -> List[Dict]:
+        """Borderline items across every channel's results, best first, capped at max_items."""
+        best: Dict[str, Dict] = {}
+        for scored_items in results:
+            for s in scored_items:
+                item = s["item"]
+                if not (self.min_score <= s["score"] < self.max_score) or not item.get("link"):
+                    continue
+                if item["id"] not in best or s["score"] > best[item["id"]]["score"]:
+                    best[item["id"]] = s
+        ranked = sorted(best.values(), key=lambda s: s["score"], reverse=True)
+        return [s["item"] for s in ranked[:self.max_items]]
+    
+    def enrich(self, items: List[Dict]) -> List[Dict]:
+        """Set item["body"] from cache or the article page; returns the items that got text."""
+        now = time.time()
+        to_fetch = []
+        for item in items:
+            cached = self.cache.get(item["id"])
+            if cached and cached["text"]:
+                item["body"] = cached["text"]
+            elif not cached or now - cached["fetched"] >= self.retry_failed_after:
+                to_fetch.append(item)
+        
+        cache_hits = len(items) - len(to_fetch)
+        if to_fetch:
+            print(f"📰 Fetching article text for {len(to_fetch)} borderline items "
+                  f"({cache_hits} cached)...")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for item, (text, error) in zip(to_fetch, pool.map(self._fetch_text, to_fetch)):
+                    self.cache[item["id"]] = {"text": text, "fetched": time.time(), "error": error}
+                    if text:
+                        item["body"] = text
+        
+        enriched = [item for item in items if item.get("body")]
+        print(f"📰 Article text for {len(enriched)}/{len(items)} borderline items")
+        return enriched
+    
+    def rescore(self, results: List[List[Dict]], scorers: List[ContentScorer]) -> List[List[Dict]]:
+        """
+        Re-score each scorer's borderline items with their article text;
+        other results are kept as-is. `results` holds one list per scorer.
+        """
+        enriched = self.enrich(self.candidates(results))
+        self.save()
+        if not enriched:
+            return results
+        
+        # Trends were already recorded from the summaries; this only re-scores
+        analyses = {item["id"]: scorers[0].analyze(item) for item in enriched}
+        rescored = []
+        for scorer, scored_items in zip(scorers, results):
+            before = sum(1 for s in scored_items if "HIGH" in s["status"])
+            scored_items = scorer.rank([
+                scorer.score_item(s["item"], analyses[s["item"]["id"]])
+                if s["item"].get("id") in analyses else s
+                for s in scored_items
+            ])
+            after = sum(1 for s in scored_items if "HIGH" in s["status"])
+            if after != before:
+                print(f"📰 {scorer.dna.data['channel_name']}: {after - before:+d} HIGH_PRIORITY "
+                      f"after reading full articles")
+            rescored.append(scored_items)
+        return rescored
+    
+    def _fetch_text(self, item: Dict) -> Tuple[str, Optional[str]]:
+        try:
+            with self._polite(urllib.parse.urlsplit(item["link"]).hostname or ""):
+                with self.http.get(item["link"], headers={"Accept": "text/html"},
+                                   timeout=self.timeout) as response:
+                    content_type = response.headers.get("Content-Type", "")
+                    if "html" not in content_type:
+                        return "", f"Not HTML: {content_type or 'no content type'}"
+                    charset = response.headers.get_content_charset() or "utf-8"
+                    html = response.read(self.max_bytes).decode(charset, errors="replace")
+            return ArticleTextExtractor.extract(html)[:self.max_chars], None
+        except Exception as e:
+            return "", f"{type(e).__name__}: {e}"[:200]
+    
+    @contextmanager
+    def _polite(self, domain: str):
+        """Hold one of the domain's slots, spacing out request starts to that domain."""
+        with self._lock:
+            slot = self._domains.setdefault(domain, {
+                "semaphore": threading.BoundedSemaphore(self.per_domain), "next_start": 0.0,
+            })
+        with slot["semaphore"]:
+            with self._lock:
+                start = max(time.time(), slot["next_start"])
+                slot["next_start"] = start + self.domain_interval
+            time.sleep(max(start - time.time(), 0))
+            yield
+
+
 # ============================================================
 # REPORT GENERATOR
 # ============================================================
@@ -327,8 +1875,10 @@ class ContentScorer:
 class ReportGenerator:
     """Generates daily reports and recommendations."""
     
-    def __init__(self, dna: ChannelDNA):
+    def __init__(self, dna: ChannelDNA, label: str = "", output_dir: Path = OUTPUT_DIR):
         self.dna = dna
+        self.label = label  # added to file names when several channels share OUTPUT_DIR
+        self.output_dir = output_dir
     
     def generate_report(self, scored_items: List[Dict]) -> str:
         """Generate a text report of recommendations."""
@@ -447,14 +1997,16 @@ class ReportGenerator:
     def save_report(self, report: str, scored_items: List[Dict]) -> Tuple[Path, Path]:
         """Save report to files."""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+        if self.label:
+            timestamp = f"{self.label}_{timestamp}"
         
         # Save text report
-        report_path = OUTPUT_DIR / f"report_{timestamp}.txt"
+        report_path = self.output_dir / f"report_{timestamp}.txt"
         with open(report_path, 'w', encoding='utf-8') as f:
             f.write(report)
         
         # Save JSON data for later use
-        json_path = OUTPUT_DIR / f"data_{timestamp}.json"
+        json_path = self.output_dir / f"data_{timestamp}.json"
         
         # Prepare serializable data
         json_data = {
@@ -472,6 +2024,329 @@ class ReportGenerator:
             json.dump(json_data, f, ensure_ascii=False, indent=2)
         
         return report_path, json_path
+    
+    def latest_data_file(self) -> Optional[Path]:
+        """Most recent JSON data file written for this channel."""
+        pattern = f"data_{self.label}_*.json" if self.label else "data_[0-9]*.json"
+        data_files = sorted(self.output_dir.glob(pattern), reverse=True)
+        return data_files[0] if data_files else None
+
+
+# ============================================================
+# SCAN ARCHIVE
+# ============================================================
+
+class ArchiveSegment:
+    """
+    One immutable archive segment, memory-mapped for queries.
+    
+    Layout (little endian):
+        b"CIARCH01"
+        records    u32 length + zlib(JSON), one per scored item
+        terms      n_terms x (u64 term hash, u32 first posting, u32 posting count),
+                   sorted by hash so lookups are a binary search
+        postings   (u32 doc id, u16 term frequency)
+        docs       n_docs x (u64 record offset, u32 scanned at, u16 score)
+        footer     u64 terms/postings/docs offsets, u32 n_terms, u32 n_docs, b"CIARCH01"
+    """
+    
+    MAGIC = b"CIARCH01"
+    TERM = struct.Struct("<QII")
+    POSTING = struct.Struct("<IH")
+    DOC = struct.Struct("<QIH")
+    LENGTH = struct.Struct("<I")
+    FOOTER = struct.Struct("<QQQII8s")
+    
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (self.terms_offset, self.postings_offset, self.docs_offset,
+         self.n_terms, self.n_docs, magic) = self.FOOTER.unpack_from(self.map, len(self.map) - self.FOOTER.size)
+        if magic != self.MAGIC or self.map[:len(self.MAGIC)] != self.MAGIC:
+            self.map.close()
+            raise ValueError(f"Not an archive segment: {path}")
+    
+    def close(self):
+        self.map.close()
+    
+    def postings(self, term_hash: int) -> List[Tuple[int, int]]:
+        """[(doc id, term frequency)] for a term hash, or [] if the term is absent."""
+        lo, hi = 0, self.n_terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_hash, first, count = self.TERM.unpack_from(self.map, self.terms_offset + mid * self.TERM.size)
+            if mid_hash < term_hash:
+                lo = mid + 1
+            elif mid_hash > term_hash:
+                hi = mid
+            else:
+                start = self.postings_offset + first * self.POSTING.size
+                return list(self.POSTING.iter_unpack(self.map[start:start + count * self.POSTING.size]))
+        return []
+    
+    def doc(self, doc_id: int) -> Tuple[int, int, int]:
+        """(record offset, scanned at, score) without decompressing the record."""
+        return self.DOC.unpack_from(self.map, self.docs_offset + doc_id * self.DOC.size)
+    
+    def record(self, doc_id: int) -> Dict:
+        offset = self.doc(doc_id)[0]
+        (length,) = self.LENGTH.unpack_from(self.map, offset)
+        start = offset + self.LENGTH.size
+        return json.loads(zlib.decompress(self.map[start:start + length]))
+    
+    def records(self):
+        for doc_id in range(self.n_docs):
+            yield self.record(doc_id)
+    
+    @classmethod
+    def write(cls, path: Path, records: List[Dict], terms_for) -> None:
+        """Write records and their inverted index to a new segment file, atomically."""
+        index: Dict[int, List[Tuple[int, int]]] = {}
+        docs = []
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(cls.MAGIC)
+            for doc_id, record in enumerate(records):
+                payload = zlib.compress(json.dumps(record, ensure_ascii=False).encode("utf-8"))
+                docs.append(cls.DOC.pack(f.tell(), int(record["scanned_at"]), record["score"]))
+                f.write(cls.LENGTH.pack(len(payload)) + payload)
+                counts: Dict[int, int] = {}
+                for term in terms_for(record):
+                    term_hash = ScanArchive.term_hash(term)
+                    counts[term_hash] = counts.get(term_hash, 0) + 1
+                for term_hash, tf in counts.items():
+                    index.setdefault(term_hash, []).append((doc_id, min(tf, 0xFFFF)))
+            
+            terms_offset = f.tell()
+            first = 0
+            for term_hash in sorted(index):
+                f.write(cls.TERM.pack(term_hash, first, len(index[term_hash])))
+                first += len(index[term_hash])
+            postings_offset = f.tell()
+            for term_hash in sorted(index):
+                f.write(b"".join(cls.POSTING.pack(doc_id, tf) for doc_id, tf in index[term_hash]))
+            docs_offset = f.tell()
+            f.write(b"".join(docs))
+            f.write(cls.FOOTER.pack(terms_offset, postings_offset, docs_offset,
+                                    len(index), len(records), cls.MAGIC))
+        os.replace(tmp_path, path)
+
+
+class ScanArchive:
+    """
+    Append-only archive of every scored item, searchable by keyword.
+    
+    Each scan appends one immutable segment; items already archived for a
+    channel are skipped. Queries memory-map the segments and read only the
+    index pages they touch plus the records they return. Segments are
+    compacted size-tiered: `merge_factor` segments of the same size tier
+    (by powers of `merge_factor` items) are merged into one, so every item
+    is rewritten only a logarithmic number of times. `max_segments` is a
+    hard cap on top of that. Appends and compactions hold an exclusive lock
+    on `.lock` in the archive dir, so concurrent scans take turns.
+    """
+    
+    def __init__(self, archive_dir: Path = STATE_DIR / "archive", merge_factor: int = 4,
+                 max_segments: int = 32, max_description_chars: int = 500):
+        self.archive_dir = archive_dir
+        self.merge_factor = merge_factor
+        self.max_segments = max_segments
+        self.max_description_chars = max_description_chars
+        self.segments: List[ArchiveSegment] = []
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        self._load_segments()
+    
+    def _load_segments(self):
+        """Sync the open segments with the segment files on disk."""
+        paths = set(self.archive_dir.glob("seg_*.cia"))
+        for segment in [s for s in self.segments if s.path not in paths]:
+            segment.close()
+            self.segments.remove(segment)
+        for path in sorted(paths - {s.path for s in self.segments}):
+            try:
+                self.segments.append(ArchiveSegment(path))
+            except (OSError, ValueError, struct.error) as e:
+                print(f"⚠️  Skipping unreadable archive segment {path.name}: {e}")
+        self.segments.sort(key=lambda s: s.path.name)
+    
+    @contextmanager
+    def _writer_lock(self):
+        """Exclusive across processes; the segments are re-read once it is held."""
+        with open(self.archive_dir / ".lock", 'a') as lock_file:
+            if HAS_FCNTL:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            # Another writer may have added or merged segments meanwhile
+            self._load_segments()
+            yield
+    
+    def close(self):
+        for segment in self.segments:
+            segment.close()
+        self.segments = []
+    
+    @staticmethod
+    def term_hash(term: str) -> int:
+        return int.from_bytes(hashlib.blake2b(term.encode("utf-8"), digest_size=8).digest(), "little")
+    
+    @staticmethod
+    def _key_term(channel: str, item_id: str) -> str:
+        # Not a word normalize_words can produce, so it never collides with text terms
+        return f"\x00id:{channel}:{item_id}"
+    
+    @classmethod
+    def _terms(cls, record: Dict) -> List[str]:
+        words = normalize_words(f"{record['title']} {record['description']}")
+        return words + [cls._key_term(record["channel"], record["id"])]
+    
+    def contains(self, channel: str, item_id: str) -> bool:
+        term_hash = self.term_hash(self._key_term(channel, item_id))
+        return any(segment.postings(term_hash) for segment in self.segments)
+    
+    def append(self, scored_items: List[Dict], channel: str, scanned_at: Optional[float] = None) -> int:
+        """Archive a scan's scored items for a channel; returns how many were new."""
+        with self._writer_lock():
+            return self._append(scored_items, channel, scanned_at)
+    
+    def _append(self, scored_items: List[Dict], channel: str, scanned_at: Optional[float]) -> int:
+        scanned_at = scanned_at if scanned_at is not None else time.time()
+        records = []
+        seen = set()
+        for s in scored_items:
+            item = s["item"]
+            item_id = item.get("id") or RSSFetcher.make_id(item.get("title", ""), item.get("link", ""))
+            if item_id in seen or self.contains(channel, item_id):
+                continue
+            seen.add(item_id)
+            records.append({
+                "id": item_id,
+                "channel": channel,
+                "scanned_at": scanned_at,
+                "score": s["score"],
+                "status": s["status"],
+                "title": item.get("title", ""),
+                "description": item.get("description", "")[:self.max_description_chars],
+                "link": item.get("link", ""),
+                "source": item.get("source", ""),
+                "published": item.get("published"),
+            })
+        if not records:
+            return 0
+        
+        path = self.archive_dir / f"seg_{time.time_ns()}.cia"
+        ArchiveSegment.write(path, records, self._terms)
+        self.segments.append(ArchiveSegment(path))
+        self._maybe_compact()
+        return len(records)
+    
+    def maybe_compact(self):
+        """Merge full size tiers until none is left, then enforce max_segments."""
+        with self._writer_lock():
+            self._maybe_compact()
+    
+    def _maybe_compact(self):
+        while True:
+            tiers: Dict[int, List[ArchiveSegment]] = {}
+            for segment in self.segments:
+                tier = int(math.log(max(segment.n_docs, 1), self.merge_factor))
+                tiers.setdefault(tier, []).append(segment)
+            full = [segments for _, segments in sorted(tiers.items()) if len(segments) >= self.merge_factor]
+            if full:
+                self._compact(full[0])
+            elif len(self.segments) > self.max_segments:
+                by_size = sorted(self.segments, key=lambda s: s.n_docs)
+                self._compact(by_size[:len(self.segments) - self.max_segments + 1])
+            else:
+                return
+    
+    def compact(self, merging: Optional[List[ArchiveSegment]] = None):
+        """Merge the given segments (default: all of them) into one."""
+        with self._writer_lock():
+            # Segments another writer merged away meanwhile are gone
+            paths = {segment.path for segment in merging} if merging is not None else None
+            self._compact([s for s in self.segments if paths is None or s.path in paths])
+    
+    def _compact(self, merging: List[ArchiveSegment]):
+        if len(merging) < 2:
+            return
+        
+        records = []
+        seen = set()
+        for segment in merging:
+            for record in segment.records():
+                key = (record["channel"], record["id"])
+                if key not in seen:
+                    seen.add(key)
+                    records.append(record)
+        
+        path = self.archive_dir / f"seg_{time.time_ns()}.cia"
+        ArchiveSegment.write(path, records, self._terms)
+        for segment in merging:
+            segment.close()
+            self.segments.remove(segment)
+            segment.path.unlink()
+        self.segments.append(ArchiveSegment(path))
+        print(f"🗜️  Compacted {len(merging)} archive segments into {path.name} ({len(records)} items)")
+    
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """
+        Ranked matches for a query: items matching more query words first,
+        then by tf-idf relevance, then newest first.
+        """
+        words = list(dict.fromkeys(normalize_words(query)))
+        if not words or not self.segments:
+            return []
+        total_docs = sum(segment.n_docs for segment in self.segments)
+        
+        matched: Dict[Tuple[int, int], int] = {}  # (segment, doc) -> query words matched
+        relevance: Dict[Tuple[int, int], float] = {}
+        for word in words:
+            term_hash = self.term_hash(word)
+            per_segment = [segment.postings(term_hash) for segment in self.segments]
+            doc_freq = sum(len(postings) for postings in per_segment)
+            if not doc_freq:
+                continue
+            idf = math.log(1 + total_docs / doc_freq)
+            for seg_no, postings in enumerate(per_segment):
+                for doc_id, tf in postings:
+                    key = (seg_no, doc_id)
+                    matched[key] = matched.get(key, 0) + 1
+                    relevance[key] = relevance.get(key, 0.0) + idf * (1 + math.log(tf))
+        if not matched:
+            return []
+        
+        # Recency only breaks ties, so only tied candidates need their doc entry read
+        def rank(key):
+            return matched[key], round(relevance[key], 6)
+        top = heapq.nlargest(limit, matched, key=rank)
+        cutoff = rank(top[-1])
+        top = [key for key in top if rank(key) > cutoff]
+        tied = [key for key in matched if rank(key) == cutoff]
+        tied.sort(key=lambda key: self.segments[key[0]].doc(key[1])[1], reverse=True)
+        top += tied[:limit - len(top)]
+        
+        results = []
+        for seg_no, doc_id in top:
+            record = self.segments[seg_no].record(doc_id)
+            record["matched"] = matched[(seg_no, doc_id)]
+            results.append(record)
+        return results
+    
+    def format_results(self, query: str, results: List[Dict], elapsed_ms: float) -> str:
+        total_docs = sum(segment.n_docs for segment in self.segments)
+        lines = [
+            "═" * 80,
+            f"🔎 \"{query}\": {len(results)} matches in {total_docs} archived items "
+            f"({len(self.segments)} segments, {elapsed_ms:.1f} ms)",
+            "═" * 80,
+        ]
+        for i, r in enumerate(results, 1):
+            scanned = datetime.fromtimestamp(r["scanned_at"]).strftime('%Y-%m-%d %H:%M')
+            lines.append(f"{i:>2}. [{r['score']:>3}] {r['title'][:90]}")
+            lines.append(f"    {scanned} · {r['source']} · {r['channel']} · {r['status']}")
+            if r["link"]:
+                lines.append(f"    {r['link']}")
+        return "\n".join(lines)
 
 
 # ============================================================
@@ -481,14 +2356,17 @@ class ReportGenerator:
 class SynopsisGenerator:
     """Generates production synopses using Claude API."""
     
-    def __init__(self, dna: ChannelDNA):
+    def __init__(self, dna: ChannelDNA, timeout: Optional[float] = None):
         self.dna = dna
         self.client = None
         
         if HAS_ANTHROPIC:
             api_key = os.environ.get("ANTHROPIC_API_KEY")
             if api_key:
-                self.client = anthropic.Anthropic(api_key=api_key)
+                # The SDK keeps its own pool and timeouts. A long Arabic synopsis can take
+                # minutes, so the feed timeout does not apply; None keeps the SDK default.
+                options = {"timeout": timeout} if timeout else {}
+                self.client = anthropic.Anthropic(api_key=api_key, **options)
     
     def generate(self, scored_item: Dict) -> str:
         """Generate a production synopsis for a scored item."""
@@ -578,6 +2456,394 @@ To enable auto-generation:
 """
 
 
+# ============================================================
+# JOB QUEUE (DISTRIBUTED SCANS)
+# ============================================================
+
+class JobQueue(ABC):
+    """
+    Leased job queue shared by a scan coordinator and its workers.
+    
+    Jobs are keyed by ID, so enqueueing the same job twice is a no-op.
+    A worker leases a job for `lease_seconds`; if it crashes, the lease
+    expires and the job is handed out again, up to `max_attempts` times.
+    Only the worker that leased a job last may complete or fail it, and
+    completing a job twice keeps the first result.
+    
+    Job dicts: id, kind, scan_id, payload, state (pending/leased/done/failed),
+    attempts, result, error.
+    """
+    
+    def __init__(self, lease_seconds: float = 120, max_attempts: int = 3):
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+    
+    @staticmethod
+    def from_settings(settings: Dict) -> "JobQueue":
+        """Build the backend named in the `queue` block of rss_feeds.json."""
+        options = {k: settings[k] for k in ("lease_seconds", "max_attempts") if k in settings}
+        backend = settings.get("backend", "sqlite")
+        if backend == "sqlite":
+            return SQLiteQueue(BASE_DIR / settings.get("path", STATE_DIR / "jobs.sqlite3"), **options)
+        if backend == "redis":
+            return RedisQueue(settings.get("redis_url", "redis://localhost:6379/0"), **options)
+        raise ValueError(f"Unknown job queue backend: {backend}")
+    
+    @abstractmethod
+    def put(self, job_id: str, kind: str, scan_id: str, payload: Dict):
+        """Enqueue a job, unless one with this ID already exists."""
+    
+    @abstractmethod
+    def lease(self, kinds: List[str], worker: str) -> Optional[Dict]:
+        """Lease the oldest available job of the first kind that has one."""
+    
+    @abstractmethod
+    def complete(self, job_id: str, result: Dict, worker: str):
+        """Store a leased job's result and mark it done."""
+    
+    @abstractmethod
+    def fail(self, job_id: str, error: str, worker: str):
+        """Give a leased job back for a retry (or mark it failed after max_attempts)."""
+    
+    @abstractmethod
+    def jobs(self, scan_id: str, kind: str) -> List[Dict]:
+        """Every job of one kind in a scan, in any state."""
+    
+    @abstractmethod
+    def purge(self, scan_id: str):
+        """Delete every job of a finished scan."""
+
+
+class SQLiteQueue(JobQueue):
+    """JobQueue in a SQLite file (WAL mode); workers on other hosts need it on a shared disk."""
+    
+    def __init__(self, path: Path = STATE_DIR / "jobs.sqlite3", **options):
+        super().__init__(**options)
+        self.path = path
+        self._local = threading.local()
+        with self._db() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY, kind TEXT NOT NULL, scan_id TEXT NOT NULL,
+                    payload TEXT NOT NULL, state TEXT NOT NULL DEFAULT 'pending',
+                    attempts INTEGER NOT NULL DEFAULT 0, lease_until REAL, worker TEXT,
+                    result TEXT, error TEXT, created REAL NOT NULL
+                )""")
+            db.execute("CREATE INDEX IF NOT EXISTS jobs_available ON jobs (kind, state, created)")
+            db.execute("CREATE INDEX IF NOT EXISTS jobs_scan ON jobs (scan_id, kind)")
+    
+    def _db(self) -> sqlite3.Connection:
+        # One connection per thread; `with db:` wraps a transaction
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30)
+            db.row_factory = sqlite3.Row
+            self._local.db = db
+        return db
+    
+    def put(self, job_id: str, kind: str, scan_id: str, payload: Dict):
+        with self._db() as db:
+            db.execute("INSERT OR IGNORE INTO jobs (id, kind, scan_id, payload, created) VALUES (?, ?, ?, ?, ?)",
+                       (job_id, kind, scan_id, json.dumps(payload, ensure_ascii=False), time.time()))
+    
+    def lease(self, kinds: List[str], worker: str) -> Optional[Dict]:
+        now = time.time()
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")  # one writer at a time, so two workers never get the same job
+        try:
+            db.execute("UPDATE jobs SET state = 'failed', error = 'Lease expired ' || attempts || ' times' "
+                       "WHERE state = 'leased' AND lease_until < ? AND attempts >= ?",
+                       (now, self.max_attempts))
+            row = None
+            for kind in kinds:
+                row = db.execute(
+                    "SELECT * FROM jobs WHERE kind = ? AND (state = 'pending' OR "
+                    "(state = 'leased' AND lease_until < ?)) ORDER BY created LIMIT 1",
+                    (kind, now)).fetchone()
+                if row:
+                    break
+            if row:
+                db.execute("UPDATE jobs SET state = 'leased', lease_until = ?, worker = ?, "
+                           "attempts = attempts + 1 WHERE id = ?",
+                           (now + self.lease_seconds, worker, row["id"]))
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return self._job(row, attempts_offset=1) if row else None
+    
+    def complete(self, job_id: str, result: Dict, worker: str):
+        with self._db() as db:
+            db.execute("UPDATE jobs SET state = 'done', result = ?, lease_until = NULL "
+                       "WHERE id = ? AND state != 'done' AND worker = ?",
+                       (json.dumps(result, ensure_ascii=False), job_id, worker))
+    
+    def fail(self, job_id: str, error: str, worker: str):
+        with self._db() as db:
+            db.execute("UPDATE jobs SET state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                       "error = ?, lease_until = NULL WHERE id = ? AND state = 'leased' AND worker = ?",
+                       (self.max_attempts, error[:500], job_id, worker))
+    
+    def jobs(self, scan_id: str, kind: str) -> List[Dict]:
+        rows = self._db().execute("SELECT * FROM jobs WHERE scan_id = ? AND kind = ?", (scan_id, kind))
+        return [self._job(row) for row in rows.fetchall()]
+    
+    def purge(self, scan_id: str):
+        with self._db() as db:
+            db.execute("DELETE FROM jobs WHERE scan_id = ?", (scan_id,))
+    
+    @staticmethod
+    def _job(row: sqlite3.Row, attempts_offset: int = 0) -> Dict:
+        return {
+            "id": row["id"],
+            "kind": row["kind"],
+            "scan_id": row["scan_id"],
+            "payload": json.loads(row["payload"]),
+            "state": "leased" if attempts_offset else row["state"],
+            "attempts": row["attempts"] + attempts_offset,
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+        }
+
+
+class RedisQueue(JobQueue):
+    """
+    JobQueue on Redis (or any server speaking its protocol).
+    
+    Each job is a hash; available job IDs wait in a list per kind and
+    leased ones sit in a sorted set by lease expiry. Leasing runs as one
+    Lua script so a job is never handed to two workers; completing and
+    failing are scripts too, so the lease holder check and the update are
+    atomic. IDs whose job is gone (purged scans) or no longer pending are
+    dropped when the lease script comes across them.
+    """
+    
+    LEASE_SCRIPT = """
+    local now, lease, max_attempts, prefix = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3]), ARGV[4]
+    for i = 6, #ARGV do
+        local kind = ARGV[i]
+        local leased = prefix .. ':leased:' .. kind
+        local pending = prefix .. ':pending:' .. kind
+        for _, id in ipairs(redis.call('ZRANGEBYSCORE', leased, '-inf', now)) do
+            redis.call('ZREM', leased, id)
+            local job = prefix .. ':job:' .. id
+            if redis.call('HGET', job, 'state') ~= 'leased' then
+                -- purged, or completed after its lease ran out
+            elseif (tonumber(redis.call('HGET', job, 'attempts')) or 0) >= max_attempts then
+                redis.call('HSET', job, 'state', 'failed', 'error', 'Lease expired ' .. max_attempts .. ' times')
+            else
+                redis.call('HSET', job, 'state', 'pending')
+                redis.call('LPUSH', pending, id)
+            end
+        end
+        local id = redis.call('LPOP', pending)
+        while id do
+            local job = prefix .. ':job:' .. id
+            if redis.call('HGET', job, 'state') == 'pending' then
+                redis.call('HSET', job, 'state', 'leased', 'worker', ARGV[5])
+                redis.call('HINCRBY', job, 'attempts', 1)
+                redis.call('ZADD', leased, now + lease, id)
+                return id
+            end
+            id = redis.call('LPOP', pending)
+        end
+    end
+    return false
+    """
+    
+    COMPLETE_SCRIPT = """
+    local prefix, id, worker, result = ARGV[1], ARGV[2], ARGV[3], ARGV[4]
+    local job = prefix .. ':job:' .. id
+    if redis.call('HGET', job, 'worker') ~= worker or redis.call('HGET', job, 'state') == 'done' then
+        return 0
+    end
+    redis.call('HSET', job, 'state', 'done', 'result', result)
+    redis.call('ZREM', prefix .. ':leased:' .. redis.call('HGET', job, 'kind'), id)
+    return 1
+    """
+    
+    FAIL_SCRIPT = """
+    local prefix, id, worker, err, max_attempts = ARGV[1], ARGV[2], ARGV[3], ARGV[4], tonumber(ARGV[5])
+    local job = prefix .. ':job:' .. id
+    if redis.call('HGET', job, 'worker') ~= worker or redis.call('HGET', job, 'state') ~= 'leased' then
+        return 0
+    end
+    local kind = redis.call('HGET', job, 'kind')
+    redis.call('ZREM', prefix .. ':leased:' .. kind, id)
+    if (tonumber(redis.call('HGET', job, 'attempts')) or 0) >= max_attempts then
+        redis.call('HSET', job, 'state', 'failed', 'error', err)
+    else
+        redis.call('HSET', job, 'state', 'pending', 'error', err)
+        redis.call('RPUSH', prefix .. ':pending:' .. kind, id)
+    end
+    return 1
+    """
+    
+    def __init__(self, url: str = "redis://localhost:6379/0", prefix: str = "ci",
+                 client=None, **options):
+        if client is None and not HAS_REDIS:
+            raise RuntimeError("redis not installed. Run: pip install redis")
+        super().__init__(**options)
+        # `client` (any redis-py compatible client, decoding responses) overrides `url`
+        self.redis = client or redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+        self._lease_script = self.redis.register_script(self.LEASE_SCRIPT)
+        self._complete_script = self.redis.register_script(self.COMPLETE_SCRIPT)
+        self._fail_script = self.redis.register_script(self.FAIL_SCRIPT)
+    
+    def _key(self, *parts: str) -> str:
+        return ":".join((self.prefix,) + parts)
+    
+    def put(self, job_id: str, kind: str, scan_id: str, payload: Dict):
+        job_key = self._key("job", job_id)
+        if not self.redis.hsetnx(job_key, "state", "pending"):
+            return  # already enqueued
+        pipe = self.redis.pipeline()
+        pipe.hset(job_key, mapping={
+            "kind": kind, "scan_id": scan_id, "attempts": 0,
+            "payload": json.dumps(payload, ensure_ascii=False),
+        })
+        pipe.sadd(self._key("scan", scan_id), job_id)
+        pipe.rpush(self._key("pending", kind), job_id)
+        pipe.execute()
+    
+    def lease(self, kinds: List[str], worker: str) -> Optional[Dict]:
+        job_id = self._lease_script(
+            args=[time.time(), self.lease_seconds, self.max_attempts, self.prefix, worker, *kinds]
+        )
+        return self._job(job_id) if job_id else None
+    
+    def complete(self, job_id: str, result: Dict, worker: str):
+        self._complete_script(args=[self.prefix, job_id, worker, json.dumps(result, ensure_ascii=False)])
+    
+    def fail(self, job_id: str, error: str, worker: str):
+        self._fail_script(args=[self.prefix, job_id, worker, error[:500], self.max_attempts])
+    
+    def jobs(self, scan_id: str, kind: str) -> List[Dict]:
+        jobs = [self._job(job_id) for job_id in self.redis.smembers(self._key("scan", scan_id))]
+        return [job for job in jobs if job and job["kind"] == kind]
+    
+    def purge(self, scan_id: str):
+        scan_key = self._key("scan", scan_id)
+        job_ids = list(self.redis.smembers(scan_key))
+        kinds = [self.redis.hget(self._key("job", job_id), "kind") for job_id in job_ids]
+        pipe = self.redis.pipeline()
+        for job_id, kind in zip(job_ids, kinds):
+            if kind:
+                pipe.lrem(self._key("pending", kind), 0, job_id)
+                pipe.zrem(self._key("leased", kind), job_id)
+            pipe.delete(self._key("job", job_id))
+        pipe.delete(scan_key)
+        pipe.execute()
+    
+    def _job(self, job_id: str) -> Optional[Dict]:
+        data = self.redis.hgetall(self._key("job", job_id))
+        if "kind" not in data or "payload" not in data:
+            return None  # purged, or never fully written
+        return {
+            "id": job_id,
+            "kind": data["kind"],
+            "scan_id": data["scan_id"],
+            "payload": json.loads(data["payload"]),
+            "state": data["state"],
+            "attempts": int(data.get("attempts", 0)),
+            "result": json.loads(data["result"]) if data.get("result") else None,
+            "error": data.get("error"),
+        }
+
+
+class ScanWorker:
+    """
+    Pulls fetch and score jobs from a JobQueue (python main.py --worker).
+    
+    Fetch jobs return a feed's items with their trend keywords, or the
+    fetch error, as their result; feed health and trend counts stay with
+    the coordinator. Score jobs score a chunk of
+    items for every channel with the trending snapshot and competitor
+    uploads the coordinator sends along. Workers must be started with the
+    same --channels as the coordinator.
+    """
+    
+    def __init__(self, queue: JobQueue, dna_paths: Optional[List[Path]] = None,
+                 poll_seconds: float = 1.0):
+        self.queue = queue
+        self.poll_seconds = poll_seconds
+        # Unique per instance: lease ownership is checked by this ID
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{os.urandom(3).hex()}"
+        self.fetcher = RSSFetcher()
+        
+        self.scorers = []
+        for path in dna_paths or [CONFIG_DIR / "channel_dna.json"]:
+            dna = ChannelDNA(path)
+            competitor_index = CompetitorIndex.from_config(dna.competitor_coverage)
+            self.scorers.append(ContentScorer(dna, competitor_index=competitor_index))
+        if len(self.scorers) > 1:
+            KeywordMatcher.shared_by(self.scorers)
+        self.slugs = [scorer.dna.slug for scorer in self.scorers]
+        self.competitor_scan = None  # scan whose competitor uploads are indexed
+    
+    def run(self, max_jobs: Optional[int] = None, exit_when_idle: bool = False):
+        """Process jobs until interrupted (or until `max_jobs` / the queue runs dry)."""
+        print(f"👷 Worker {self.worker_id} serving {', '.join(self.slugs)}")
+        done = 0
+        while max_jobs is None or done < max_jobs:
+            job = self.queue.lease(["fetch", "score"], self.worker_id)
+            if job is None:
+                if exit_when_idle:
+                    break
+                time.sleep(self.poll_seconds)
+                continue
+            try:
+                handler = self.fetch if job["kind"] == "fetch" else self.score
+                self.queue.complete(job["id"], handler(job["scan_id"], job["payload"]), self.worker_id)
+            except Exception as e:
+                print(f"⚠️  Job {job['id']} failed (attempt {job['attempts']}): {e}")
+                self.queue.fail(job["id"], f"{type(e).__name__}: {e}", self.worker_id)
+            done += 1
+        return done
+    
+    def _check_channels(self, payload: Dict):
+        if payload["channels"] != self.slugs:
+            raise ValueError(f"Worker serves {self.slugs}, scan needs {payload['channels']}")
+    
+    def fetch(self, scan_id: str, payload: Dict) -> Dict:
+        self._check_channels(payload)
+        feed_config = payload["feed"]
+        cutoff_time = datetime.fromisoformat(payload["cutoff"])
+        started = time.time()
+        try:
+            items = self.fetcher.fetch_items(feed_config, payload["max_items"], cutoff_time,
+                                             payload.get("timeout"))
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"[:200], "latency": time.time() - started}
+        # Trend mentions are extracted here so the coordinator never runs the matcher
+        lead = self.scorers[0]
+        keywords = {item["id"]: lead.trend_keywords(lead.analyze(item)) for item in items}
+        print(f"📡 {feed_config['name']}: {len(items)} items")
+        return {"items": items, "keywords": keywords, "latency": time.time() - started}
+    
+    def score(self, scan_id: str, payload: Dict) -> Dict:
+        self._check_channels(payload)
+        if self.competitor_scan != scan_id:
+            # Rebuilt per scan: the index only grows, and a worker outlives many scans.
+            # Uploads come from the coordinator so every worker indexes the same ones.
+            for scorer, uploads in zip(self.scorers, payload["competitor_uploads"]):
+                scorer.competitor_index = CompetitorIndex.from_config(scorer.dna.competitor_coverage)
+                for video in uploads:
+                    scorer.competitor_index.add(**video)
+            self.competitor_scan = scan_id
+        
+        items = payload["items"]
+        analyses = [self.scorers[0].analyze(item) for item in items]
+        results = []
+        for scorer in self.scorers:
+            scorer.trending = payload["trending"]
+            results.append([scorer.score_item(item, a) for item, a in zip(items, analyses)])
+        print(f"🔍 Scored {len(items)} items")
+        return {"results": results}
+
+
 # ============================================================
 # MAIN APPLICATION
 # ============================================================
@@ -585,40 +2851,359 @@ To enable auto-generation:
 class ContentIntelligenceSystem:
     """Main application class."""
     
-    def __init__(self):
-        self.dna = ChannelDNA()
-        self.fetcher = RSSFetcher()
-        self.scorer = ContentScorer(self.dna)
-        self.reporter = ReportGenerator(self.dna)
-        self.synopsis_gen = SynopsisGenerator(self.dna)
+    def __init__(self, dna_paths: Optional[List[Path]] = None, replay: Optional[Path] = None,
+                 state_dir: Path = STATE_DIR, output_dir: Path = OUTPUT_DIR):
+        # A replay reads feeds from a recorded bundle and leaves all persisted state alone
+        self.bundle = FeedBundle.open(replay) if replay else None
+        self.fetcher = RSSFetcher(bundle=self.bundle, state_dir=state_dir)
+        self.scheduler = FeedScheduler(state_dir / "feed_schedule.json",
+                                       **self.fetcher.settings.get("scheduler", {}))
+        trending = self.fetcher.settings.get("trending", {})
+        if self.bundle:
+            self.trend_tracker = TrendTracker(**{**trending, "state_path": None})
+            self.trend_tracker.restore(self.bundle.manifest.get("trends") or {})
+            self.trend_tracker.clock = lambda: self.bundle.recorded_at
+        else:
+            self.trend_tracker = TrendTracker(state_dir / "trends.json", **trending)
+        self.competitor_uploads = CompetitorUploads(None if self.bundle else state_dir / "competitor_uploads.json")
+        self.output_dir = output_dir
+        output_dir = output_dir / "replay" / replay.stem if replay else output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # One entry per show; several DNA files share a single fetch + scan
+        dna_paths = dna_paths or [CONFIG_DIR / "channel_dna.json"]
+        self.channels = []
+        for path in dna_paths:
+            dna = ChannelDNA(path)
+            competitor_index = CompetitorIndex.from_config(dna.competitor_coverage)
+            self.channels.append({
+                "dna": dna,
+                "competitor_index": competitor_index,
+                "scorer": ContentScorer(dna, self.trend_tracker, competitor_index),
+                "reporter": ReportGenerator(dna, dna.slug if len(dna_paths) > 1 else "", output_dir),
+            })
+        self.multi_scorer = (
+            MultiChannelScorer([c["scorer"] for c in self.channels]) if len(self.channels) > 1 else None
+        )
+        
+        # The first channel is the primary one (--test, --synopsis)
+        self.dna = self.channels[0]["dna"]
+        self.competitor_index = self.channels[0]["competitor_index"]
+        self.scorer = self.channels[0]["scorer"]
+        self.reporter = self.channels[0]["reporter"]
+        self.synopsis_gen = SynopsisGenerator(
+            self.dna, self.fetcher.settings.get("http", {}).get("llm_timeout_seconds")
+        )
         self.last_results = None
+        
+        self.archive = ScanArchive(state_dir / "archive", **self.fetcher.settings.get("archive", {}))
+        
+        # Optional: fetch article text for borderline items and re-score them
+        enrichment = dict(self.fetcher.settings.get("enrichment", {}))
+        self.enricher = (
+            ArticleEnricher(self.fetcher.http, state_dir / "article_cache.json", **enrichment)
+            if enrichment.pop("enabled", False) else None
+        )
     
-    def run_full_scan(self) -> str:
-        """Run a full RSS scan and generate report."""
+    def run_full_scan(self, all_feeds: bool = False, record: bool = False) -> str:
+        """Run an RSS scan of the feeds that are due (or all feeds) and generate report(s)."""
         print("\n🚀 Starting Content Intelligence Scan...\n")
         
-        # Fetch RSS feeds
-        items = self.fetcher.fetch_all()
+        # Pick feeds that are due according to their learned schedules
+        feeds = self.fetcher.feeds if all_feeds else self.scheduler.due_feeds(self.fetcher.feeds)
+        if not feeds:
+            return self._nothing_due()
+        print(f"⏱️ Polling {len(feeds)}/{len(self.fetcher.feeds)} feeds "
+              f"({len(self.fetcher.feeds) - len(feeds)} not due yet)\n")
+        
+        # Optionally keep the raw payloads so this scan can be replayed offline
+        if record:
+            bundle_path = self.output_dir / "recordings" / f"scan_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"
+            self.fetcher.bundle = FeedBundle.create(bundle_path, feeds, self.trend_tracker.snapshot())
+        try:
+            items = self._fetch(feeds)
+        finally:
+            if record:
+                self.fetcher.bundle.close()
+                self.fetcher.bundle = None
+                print(f"💾 Recorded feed payloads: {bundle_path}")
         
         if not items:
+            self._reschedule(feeds, [], [])
             return "❌ No items fetched. Check RSS configuration and network."
         
-        # Score items
-        print(f"\n🔍 Scoring {len(items)} items against Channel DNA...")
-        scored_items = self.scorer.score_batch(items)
-        self.last_results = scored_items
-        
-        # Generate report
-        print("📝 Generating report...")
-        report = self.reporter.generate_report(scored_items)
+        return self._finish_scan(feeds, items, self._score(items))
+    
+    def run_coordinated_scan(self, queue: JobQueue, all_feeds: bool = False) -> str:
+        """
+        Run a scan through worker processes (python main.py --worker): one
+        fetch job per feed, then score jobs of `score_chunk` items. Schedules,
+        feed health, trends, reports and the archive stay with the coordinator.
+        """
+        options = self.fetcher.settings.get("queue", {})
+        wait_seconds = options.get("wait_seconds", 600)
+        print("\n🚀 Starting coordinated Content Intelligence Scan...\n")
+        
+        feeds = self.fetcher.feeds if all_feeds else self.scheduler.due_feeds(self.fetcher.feeds)
+        if not feeds:
+            return self._nothing_due()
+        scan_id = f"scan_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+        slugs = [channel["dna"].slug for channel in self.channels]
+        
+        # ----- fetch jobs, one per feed whose circuit allows it -----
+        health = self.fetcher.health
+        self.fetcher.failed_feeds = set()
+        cutoff_time = self.fetcher.cutoff_time().isoformat()
+        by_name = {}
+        for feed_config in feeds:
+            name = feed_config["name"]
+            if not health.allow(name):
+                self.fetcher.failed_feeds.add(name)
+                continue
+            by_name[name] = feed_config
+            queue.put(f"{scan_id}:fetch:{name}", "fetch", scan_id, {
+                "feed": feed_config,
+                "max_items": self.fetcher.settings.get("max_items_per_feed", 20),
+                "cutoff": cutoff_time,
+                "timeout": health.probe_timeout if health.is_probe(name) else None,
+                "channels": slugs,
+            })
+        print(f"📤 {scan_id}: queued {len(by_name)} fetch jobs "
+              f"({len(feeds) - len(by_name)} feeds skipped or not due)")
+        
+        items = []
+        keywords: Dict[str, List[str]] = {}  # item id -> trend keywords, extracted by the worker
+        unfinished = set(by_name)
+        # Feed order, as a local scan fetches them: it decides which of two equal titles is kept
+        feed_order = {name: i for i, name in enumerate(by_name)}
+        fetch_jobs = self._wait_for_jobs(queue, scan_id, "fetch", len(by_name), wait_seconds)
+        for job in sorted(fetch_jobs, key=lambda job: feed_order[job["payload"]["feed"]["name"]]):
+            name = job["payload"]["feed"]["name"]
+            result = job["result"]
+            if not result:
+                # No worker got to it (or workers kept dying): not the feed's fault
+                print(f"⏰ {name} not fetched: {job['error'] or 'not finished in time'}")
+                continue
+            unfinished.discard(name)
+            if "error" in result:
+                self.fetcher.failed_feeds.add(name)
+                health.record_failure(name, RuntimeError(result["error"]), result["latency"])
+                print(f"⚠️  Error fetching {name}: {result['error']}")
+                continue
+            health.record_success(name, result["latency"])
+            for item in result["items"]:
+                if item["id"] not in keywords:  # a retried job may have been completed twice
+                    keywords[item["id"]] = result["keywords"][item["id"]]
+                    items.append(item)
+        health.save()
+        print(f"✅ Fetched {len(items)} items from "
+              f"{len(by_name) - len(unfinished) - len(self.fetcher.failed_feeds & set(by_name))} feeds")
+        # Unfinished feeds keep their schedule, so they are still due next run
+        feeds = [feed_config for feed_config in feeds if feed_config["name"] not in unfinished]
         
-        # Save files
-        report_path, json_path = self.reporter.save_report(report, scored_items)
-        print(f"\n✅ Report saved: {report_path}")
-        print(f"✅ Data saved: {json_path}")
+        if not items:
+            self._reschedule(feeds, [], [])
+            queue.purge(scan_id)
+            return "❌ No items fetched. Check RSS configuration, network and workers."
+        
+        # Competitor uploads are fetched once here and shipped with every score job,
+        # so the coordinator (which re-scores enriched items) and workers share one index
+        competitor_uploads = self._index_competitor_uploads()
+        
+        # ----- trends are counted here once, from the workers' keywords, then score jobs -----
+        lead = self.channels[0]["scorer"]
+        lead.update_trends(items, keywords=keywords)
+        for channel in self.channels[1:]:
+            channel["scorer"].trending = lead.trending
+        chunk = options.get("score_chunk", 50)
+        chunks = [items[i:i + chunk] for i in range(0, len(items), chunk)]
+        for chunk_items in chunks:
+            key = hashlib.md5("".join(item["id"] for item in chunk_items).encode()).hexdigest()[:12]
+            queue.put(f"{scan_id}:score:{key}", "score", scan_id, {
+                "items": chunk_items,
+                "trending": lead.trending,
+                "channels": slugs,
+                "competitor_uploads": competitor_uploads,
+            })
+        print(f"📤 Queued {len(chunks)} score jobs for {len(self.channels)} channel(s)")
+        
+        merged: List[List[Dict]] = [[] for _ in self.channels]
+        scored_ids = set()
+        for job in self._wait_for_jobs(queue, scan_id, "score", len(chunks), wait_seconds):
+            if not job["result"]:
+                print(f"⚠️  Score job {job['id']} did not finish: {job['error'] or 'timed out'}")
+                continue
+            for channel_results, scored_items in zip(merged, job["result"]["results"]):
+                channel_results.extend(s for s in scored_items if s["item"]["id"] not in scored_ids)
+            scored_ids.update(item["id"] for item in job["payload"]["items"])
+        print(f"🔍 Merged {len(scored_ids)}/{len(items)} scored items")
+        if not scored_ids:
+            self.trend_tracker.save()
+            self._reschedule(feeds, items, [])
+            queue.purge(scan_id)
+            return "❌ No items scored. Check that workers run with the same --channels."
+        # Back into fetch order first: rank() keeps the first of equal titles and scores, as a local scan does
+        position = {item["id"]: i for i, item in enumerate(items)}
+        results = [
+            channel["scorer"].rank(sorted(scored, key=lambda s: position[s["item"]["id"]]))
+            for channel, scored in zip(self.channels, merged)
+        ]
+        if self.scorer.trending:
+            print(f"📈 Trending now: {', '.join(sorted(self.scorer.trending))}")
         
+        report = self._finish_scan(feeds, items, results)
+        queue.purge(scan_id)
         return report
     
+    @staticmethod
+    def _wait_for_jobs(queue: JobQueue, scan_id: str, kind: str, expected: int,
+                       wait_seconds: float) -> List[Dict]:
+        """Poll until every job of a kind is done or failed, or the wait runs out."""
+        deadline = time.time() + wait_seconds
+        while True:
+            jobs = queue.jobs(scan_id, kind)
+            finished = [job for job in jobs if job["state"] in ("done", "failed")]
+            if len(finished) >= expected or time.time() >= deadline:
+                if len(finished) < expected:
+                    print(f"⏰ {expected - len(finished)} {kind} jobs unfinished after {wait_seconds}s")
+                return jobs
+            time.sleep(0.5)
+    
+    def _nothing_due(self) -> str:
+        if not self.fetcher.feeds:
+            return "❌ No enabled feeds with a URL in rss_feeds.json."
+        next_poll = self.scheduler.next_poll()
+        if next_poll is None:
+            return "⏸️ No feeds due yet (use --all-feeds to force)."
+        return (f"⏸️ No feeds due yet. Next poll at {datetime.fromtimestamp(next_poll).strftime('%H:%M')} "
+                f"(use --all-feeds to force).")
+    
+    def _finish_scan(self, feeds: List[Dict], items: List[Dict], results: List[List[Dict]]) -> str:
+        """Enrich, persist state, write reports and archive a scan's ranked results."""
+        if self.enricher:
+            results = self.enricher.rescore(results, [channel["scorer"] for channel in self.channels])
+        self.last_results = results[0]
+        self.trend_tracker.save()
+        self._reschedule(feeds, items, [s for scored_items in results for s in scored_items])
+        
+        reports = self._write_reports(results)
+        for channel, scored_items in zip(self.channels, results):
+            archived = self.archive.append(scored_items, channel["dna"].data["channel_name"])
+            print(f"🗄️  Archived {archived} new items for {channel['dna'].data['channel_name']}")
+        
+        return "\n".join(reports)
+    
+    def run_replay(self) -> str:
+        """
+        Push a recorded bundle through the same parse -> score -> report path,
+        with no network and without touching schedules, health, trends,
+        article cache or archive.
+        """
+        recorded = datetime.fromtimestamp(self.bundle.recorded_at).strftime('%Y-%m-%d %H:%M:%S')
+        print(f"\n⏪ Replaying {self.bundle.path.name} (recorded {recorded})\n")
+        
+        timings = {}
+        started = time.perf_counter()
+        items = self._fetch(self.bundle.feeds)
+        timings["parse"] = time.perf_counter() - started
+        if not items:
+            return "❌ No items in recording."
+        
+        started = time.perf_counter()
+        results = self._score(items)
+        self.last_results = results[0]
+        timings["score"] = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        reports = self._write_reports(results)
+        timings["report"] = time.perf_counter() - started
+        
+        total = sum(timings.values())
+        payload_bytes = sum(p.get("bytes", 0) for p in self.bundle.manifest["payloads"].values())
+        print(f"\n⏱️ Replay: {len(self.bundle.feeds)} feeds, {payload_bytes // 1024} KB, {len(items)} items, "
+              f"{len(self.channels)} channel(s)")
+        for stage, seconds in timings.items():
+            print(f"   {stage:<7} {seconds * 1000:>9.1f} ms")
+        print(f"   {'total':<7} {total * 1000:>9.1f} ms ({len(items) / total:.0f} items/s)")
+        self.bundle.close()
+        return "\n".join(reports)
+    
+    def _fetch(self, feeds: List[Dict]) -> List[Dict]:
+        """Fetch RSS feeds (once, shared by every channel) and competitor uploads."""
+        items = self.fetcher.fetch_all(feeds)
+        self._index_competitor_uploads()
+        return items
+    
+    def _index_competitor_uploads(self) -> List[List[Dict]]:
+        """
+        Fetch the top-N competitor channels of every channel, each only once,
+        and index their uploads. Returns the uploads indexed per channel.
+        """
+        top_channels = [
+            channel["competitor_index"].channels[:channel["dna"].competitor_coverage.get("feeds_top_n", 0)]
+            for channel in self.channels
+        ]
+        bundle = self.fetcher.bundle
+        if self.fetcher.replaying and "competitor_uploads" in bundle.manifest:
+            self.competitor_uploads.restore(bundle.manifest["competitor_uploads"])
+        else:
+            self.competitor_uploads.fetch([c for channels in top_channels for c in channels], self.fetcher)
+            self.competitor_uploads.save()
+            if bundle:
+                # Uploads kept from earlier scans are not in the payloads; replay needs them too
+                bundle.manifest["competitor_uploads"] = self.competitor_uploads.snapshot()
+        
+        uploads = []
+        for channel, channels in zip(self.channels, top_channels):
+            videos = self.competitor_uploads.videos(channels)
+            for video in videos:
+                channel["competitor_index"].add(**video)
+            uploads.append(videos)
+        return uploads
+    
+    def _score(self, items: List[Dict]) -> List[List[Dict]]:
+        """Ranked results for every channel."""
+        print(f"\n🔍 Scoring {len(items)} items against {len(self.channels)} Channel DNA profile(s)...")
+        if self.multi_scorer:
+            results = self.multi_scorer.score_batch(items)
+        else:
+            results = [self.scorer.score_batch(items)]
+        if self.scorer.trending:
+            print(f"📈 Trending now: {', '.join(sorted(self.scorer.trending))}")
+        return results
+    
+    def _write_reports(self, results: List[List[Dict]]) -> List[str]:
+        reports = []
+        for channel, scored_items in zip(self.channels, results):
+            # Generate report
+            print(f"📝 Generating report for {channel['dna'].data['channel_name']}...")
+            report = channel["reporter"].generate_report(scored_items)
+            
+            # Save files
+            report_path, json_path = channel["reporter"].save_report(report, scored_items)
+            print(f"\n✅ Report saved: {report_path}")
+            print(f"✅ Data saved: {json_path}")
+            reports.append(report)
+        return reports
+    
+    def _reschedule(self, feeds: List[Dict], items: List[Dict], scored_items: List[Dict]):
+        """Feed per-feed volume and HIGH_PRIORITY yield back into the scheduler."""
+        by_source: Dict[str, List[Dict]] = {}
+        for item in items:
+            by_source.setdefault(item["source"], []).append(item)
+        high_by_source: Dict[str, int] = {}
+        for s in scored_items:
+            if "HIGH" in s["status"]:
+                source = s["item"]["source"]
+                high_by_source[source] = high_by_source.get(source, 0) + 1
+        
+        for feed_config in feeds:
+            name = feed_config["name"]
+            if name not in self.fetcher.failed_feeds:
+                self.scheduler.record_poll(feed_config, by_source.get(name, []),
+                                           high_by_source.get(name, 0))
+        self.scheduler.save()
+    
     def run_test(self) -> str:
         """Run with sample data for testing."""
         print("\n🧪 Running test with sample data...\n")
@@ -724,9 +3309,9 @@ class ContentIntelligenceSystem:
         """Generate synopsis for item at given index."""
         if not self.last_results:
             # Try to load latest data file
-            data_files = sorted(OUTPUT_DIR.glob("data_*.json"), reverse=True)
-            if data_files:
-                with open(data_files[0], 'r', encoding='utf-8') as f:
+            data_file = self.reporter.latest_data_file()
+            if data_file:
+                with open(data_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     self.last_results = data.get("items", [])
             else:
@@ -744,16 +3329,66 @@ class ContentIntelligenceSystem:
 # ============================================================
 
 def main():
-    system = ContentIntelligenceSystem()
+    # --channels <dna.json> [<dna.json> ...] scores every show in one pass
+    args = sys.argv[1:]
+    dna_paths = None
+    if "--channels" in args:
+        start = args.index("--channels")
+        end = start + 1
+        while end < len(args) and not args[end].startswith("--"):
+            end += 1
+        dna_paths = [Path(p) for p in args[start + 1:end]]
+        del args[start:end]
+        if not dna_paths:
+            print("❌ No DNA files given. Use: python main.py --channels <dna.json> [<dna.json> ...]")
+            return
+    
+    # Searching the archive needs no feeds, DNA or network
+    if args and args[0] == "--search":
+        query = " ".join(args[1:])
+        if not query:
+            print("❌ No query given. Use: python main.py --search <words>")
+            return
+        with open(CONFIG_DIR / "rss_feeds.json", 'r', encoding='utf-8') as f:
+            archive = ScanArchive(**json.load(f).get("settings", {}).get("archive", {}))
+        started = time.perf_counter()
+        results = archive.search(query)
+        print(archive.format_results(query, results, (time.perf_counter() - started) * 1000))
+        archive.close()
+        return
+    
+    # Distributed scans: workers pull fetch/score jobs that a coordinator queues
+    if args and args[0] == "--worker":
+        with open(CONFIG_DIR / "rss_feeds.json", 'r', encoding='utf-8') as f:
+            queue = JobQueue.from_settings(json.load(f).get("settings", {}).get("queue", {}))
+        try:
+            ScanWorker(queue, dna_paths).run()
+        except KeyboardInterrupt:
+            print("\n👋 Worker stopped")
+        return
+    
+    # --record keeps this scan's raw feed payloads for --replay
+    record = "--record" in args
+    if record:
+        args.remove("--record")
     
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--test":
+    replay = None
+    if args and args[0] == "--replay":
+        if len(args) < 2:
+            print("❌ No bundle given. Use: python main.py --replay <bundle.zip>")
+            return
+        replay = Path(args[1])
+    
+    system = ContentIntelligenceSystem(dna_paths, replay)
+    
+    if args:
+        if args[0] == "--test":
             report = system.run_test()
             print(report)
         
-        elif sys.argv[1] == "--synopsis" and len(sys.argv) > 2:
+        elif args[0] == "--synopsis" and len(args) > 1:
             try:
-                index = int(sys.argv[2])
+                index = int(args[1])
                 synopsis = system.generate_synopsis(index)
                 print(synopsis)
                 
@@ -766,16 +3401,32 @@ def main():
             except ValueError:
                 print("❌ Invalid index. Use: python main.py --synopsis <number>")
         
-        elif sys.argv[1] == "--help":
+        elif args[0] == "--feed-health":
+            print(system.fetcher.health.report(system.fetcher.feeds))
+        
+        elif args[0] == "--all-feeds":
+            report = system.run_full_scan(all_feeds=True, record=record)
+            print(report)
+        
+        elif args[0] == "--coordinator":
+            queue = JobQueue.from_settings(system.fetcher.settings.get("queue", {}))
+            report = system.run_coordinated_scan(queue, all_feeds="--all-feeds" in args[1:])
+            print(report)
+        
+        elif args[0] == "--replay":
+            report = system.run_replay()
+            print(report)
+        
+        elif args[0] == "--help":
             print(__doc__)
         
         else:
-            print(f"Unknown option: {sys.argv[1]}")
+            print(f"Unknown option: {args[0]}")
             print("Use --help for usage information")
     
     else:
         # Full scan
-        report = system.run_full_scan()
+        report = system.run_full_scan(record=record)
         print(report)
 
 
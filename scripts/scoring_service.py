@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Content Intelligence Scoring Service
+====================================
+Keeps ChannelDNA and the compiled ContentScorer warm in memory and serves
+scores over HTTP, so the Next.js app does not pay Python startup, config
+load and DNA parsing on every request.
+
+Usage:
+    python scoring_service.py                          # 127.0.0.1:8787, default DNA
+    python scoring_service.py --port 9000 --dna config/channel_dna.json
+
+Endpoints:
+    GET  /ready          Readiness + loaded DNA info
+    GET  /metrics        Request counters and latency histograms (Prometheus text)
+    POST /score          {"item": {...}}            -> scored item
+    POST /score/batch    {"items": [...], "ranked": false} -> {"results": [...]}
+    POST /reload         Re-read DNA/competitor/trend state from disk
+
+The DNA file is also reloaded automatically when its mtime changes, and on SIGHUP;
+the trending set and the competitor uploads are refreshed whenever a scan
+rewrites their state files. Trend thresholds come from `settings.trending`
+in rss_feeds.json, as in scans.
+"""
+
+import argparse
+import asyncio
+import json
+import signal
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from main import (
+    CONFIG_DIR, STATE_DIR, ChannelDNA, CompetitorIndex, CompetitorUploads, ContentScorer, TrendTracker
+)
+
+
+MAX_BODY_BYTES = 10 * 1024 * 1024
+LATENCY_BUCKETS_MS = [1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+
+
+# ============================================================
+# METRICS
+# ============================================================
+
+class LatencyHistogram:
+    """Cumulative latency histogram in the Prometheus style."""
+    
+    def __init__(self, buckets: List[float] = LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.total = 0
+        self.sum_ms = 0.0
+    
+    def observe(self, latency_ms: float):
+        self.total += 1
+        self.sum_ms += latency_ms
+        for i, bound in enumerate(self.buckets):
+            if latency_ms <= bound:
+                self.counts[i] += 1
+                return
+        self.counts[-1] += 1
+    
+    def render(self, name: str, labels: str) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.total}')
+        lines.append(f'{name}_sum{{{labels}}} {self.sum_ms:.3f}')
+        lines.append(f'{name}_count{{{labels}}} {self.total}')
+        return lines
+
+
+# ============================================================
+# SCORING STATE
+# ============================================================
+
+class ScoringState:
+    """Everything loaded from disk for scoring; replaced as a whole on reload."""
+    
+    def __init__(self, dna_path: Path, trend_path: Optional[Path], uploads_path: Optional[Path],
+                 feeds_config_path: Path):
+        self.dna_path = dna_path
+        self.dna_mtime = dna_path.stat().st_mtime
+        self.dna = ChannelDNA(dna_path)
+        with open(feeds_config_path, 'r', encoding='utf-8') as f:
+            self.trending_settings = json.load(f).get("settings", {}).get("trending", {})
+        self.scorer = ContentScorer(self.dna)
+        # Compile the keyword automaton now rather than on the first request
+        self.scorer.matcher.find("")
+        
+        self.trend_path = trend_path
+        self.trends_mtime = None
+        self.refresh_trending()
+        self.uploads_path = uploads_path
+        self.uploads_mtime = None
+        self.refresh_competitors()
+        self.loaded_at = time.time()
+    
+    @staticmethod
+    def _file_mtime(path: Optional[Path]) -> Optional[float]:
+        try:
+            return path.stat().st_mtime if path else None
+        except OSError:
+            return None
+    
+    def refresh_trending(self):
+        """Re-read trend state, which scans keep rewriting; the service only reads it."""
+        self.trends_mtime = self._file_mtime(self.trend_path)
+        self.scorer.trending = (
+            TrendTracker(state_path=self.trend_path, **self.trending_settings).trending_keywords()
+            if self.trends_mtime is not None else {}
+        )
+    
+    def trends_changed(self) -> bool:
+        return self._file_mtime(self.trend_path) != self.trends_mtime
+    
+    def refresh_competitors(self):
+        """Rebuild the competitor index with the uploads the last scan fetched."""
+        self.uploads_mtime = self._file_mtime(self.uploads_path)
+        coverage = self.dna.competitor_coverage
+        index = CompetitorIndex.from_config(coverage)
+        if self.uploads_mtime is not None:
+            uploads = CompetitorUploads(self.uploads_path)
+            for video in uploads.videos(index.channels[:coverage.get("feeds_top_n", 0)]):
+                index.add(**video)
+        self.scorer.competitor_index = index
+    
+    def uploads_changed(self) -> bool:
+        return self._file_mtime(self.uploads_path) != self.uploads_mtime
+
+
+class ScoringService:
+    """Async HTTP/1.1 front end around a warm ContentScorer."""
+    
+    def __init__(self, dna_path: Path, trend_path: Optional[Path] = None,
+                 uploads_path: Optional[Path] = None,
+                 feeds_config_path: Path = CONFIG_DIR / "rss_feeds.json",
+                 reload_check_seconds: float = 5):
+        self.dna_path = dna_path
+        self.trend_path = trend_path
+        self.uploads_path = uploads_path
+        self.feeds_config_path = feeds_config_path
+        self.reload_check_seconds = reload_check_seconds
+        self.state: Optional[ScoringState] = None
+        self.histograms: Dict[Tuple[str, int], LatencyHistogram] = {}
+        self.items_scored = 0
+        self._last_reload_check = 0.0
+        
+        self.routes = {
+            ("GET", "/ready"): self.handle_ready,
+            ("GET", "/metrics"): self.handle_metrics,
+            ("POST", "/score"): self.handle_score,
+            ("POST", "/score/batch"): self.handle_batch,
+            ("POST", "/reload"): self.handle_reload,
+        }
+    
+    def reload(self) -> ScoringState:
+        """Load fresh state from disk; the old state keeps serving if this fails."""
+        state = ScoringState(self.dna_path, self.trend_path, self.uploads_path, self.feeds_config_path)
+        self.state = state
+        print(f"🧬 DNA loaded: {state.dna.data.get('channel_name', self.dna_path.name)}")
+        return state
+    
+    def reload_safely(self):
+        try:
+            self.reload()
+        except Exception as e:
+            print(f"⚠️  DNA reload failed, keeping previous version: {e}")
+    
+    def _maybe_reload(self):
+        now = time.time()
+        if now - self._last_reload_check < self.reload_check_seconds:
+            return
+        self._last_reload_check = now
+        try:
+            changed = self.dna_path.stat().st_mtime != self.state.dna_mtime
+        except OSError:
+            changed = False
+        if changed:
+            self.reload_safely()
+            return
+        if self.state.trends_changed():
+            try:
+                self.state.refresh_trending()
+            except Exception as e:
+                print(f"⚠️  Trend refresh failed, keeping previous trending set: {e}")
+        if self.state.uploads_changed():
+            try:
+                self.state.refresh_competitors()
+            except Exception as e:
+                print(f"⚠️  Competitor refresh failed, keeping previous uploads: {e}")
+    
+    # ----- handlers -----
+    
+    async def handle_ready(self, body: Optional[Dict]) -> Tuple[int, Dict]:
+        state = self.state
+        return 200, {
+            "ready": state is not None,
+            "channel": state.dna.data.get("channel_name") if state else None,
+            "dna_path": str(self.dna_path),
+            "dna_loaded_at": state.loaded_at if state else None,
+            "trending": sorted(state.scorer.trending) if state else [],
+            "items_scored": self.items_scored,
+        }
+    
+    async def handle_metrics(self, body: Optional[Dict]) -> Tuple[int, str]:
+        lines = [
+            "# TYPE scoring_request_latency_ms histogram",
+        ]
+        for (path, status), histogram in sorted(self.histograms.items()):
+            lines.extend(histogram.render("scoring_request_latency_ms",
+                                          f'path="{path}",status="{status}"'))
+        lines.append("# TYPE scoring_items_scored_total counter")
+        lines.append(f"scoring_items_scored_total {self.items_scored}")
+        return 200, "\n".join(lines) + "\n"
+    
+    @staticmethod
+    def _invalid_item(item) -> Optional[str]:
+        if not isinstance(item, dict):
+            return "Each item must be an object"
+        for field in ("title", "description", "body"):
+            if field in item and not isinstance(item[field], str):
+                return f"Item field '{field}' must be a string"
+        return None
+    
+    async def handle_score(self, body: Optional[Dict]) -> Tuple[int, Dict]:
+        item = body.get("item") if isinstance(body, dict) else None
+        if not isinstance(item, dict):
+            return 400, {"error": "Body must be {\"item\": {...}}"}
+        error = self._invalid_item(item)
+        if error:
+            return 400, {"error": error}
+        self.items_scored += 1
+        return 200, self.state.scorer.score_item(item)
+    
+    async def handle_batch(self, body: Optional[Dict]) -> Tuple[int, Dict]:
+        items = body.get("items") if isinstance(body, dict) else None
+        if not isinstance(items, list) or not all(isinstance(i, dict) for i in items):
+            return 400, {"error": "Body must be {\"items\": [{...}, ...]}"}
+        error = next((e for e in map(self._invalid_item, items) if e), None)
+        if error:
+            return 400, {"error": error}
+        
+        scorer = self.state.scorer
+        results = [scorer.score_item(item) for item in items]
+        if body.get("ranked"):
+            results = scorer.rank(results)
+        self.items_scored += len(items)
+        return 200, {"results": results}
+    
+    async def handle_reload(self, body: Optional[Dict]) -> Tuple[int, Dict]:
+        try:
+            state = self.reload()
+        except Exception as e:
+            return 500, {"error": f"Reload failed, previous DNA still active: {e}"}
+        return 200, {"reloaded": True, "dna_loaded_at": state.loaded_at}
+    
+    # ----- HTTP plumbing -----
+    
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "Malformed request line"}, False)
+                    break
+                
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {"error": "Invalid Content-Length"}, False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": "Body too large"}, False)
+                    break
+                raw_body = await reader.readexactly(length) if length else b""
+                
+                started = time.perf_counter()
+                path = target.split("?", 1)[0]
+                status, payload = await self._dispatch(method, path, raw_body)
+                await self._respond(writer, status, payload, keep_alive)
+                self._observe(path, status, (time.perf_counter() - started) * 1000)
+                
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+    
+    async def _dispatch(self, method: str, path: str, raw_body: bytes):
+        handler = self.routes.get((method, path))
+        if handler is None:
+            allowed = [m for (m, p) in self.routes if p == path]
+            return (405, {"error": f"Use {', '.join(allowed)}"}) if allowed else (404, {"error": "Not found"})
+        
+        body = None
+        if raw_body:
+            try:
+                body = json.loads(raw_body)
+            except json.JSONDecodeError as e:
+                return 400, {"error": f"Invalid JSON: {e}"}
+        
+        if path.startswith("/score"):
+            self._maybe_reload()
+        try:
+            return await handler(body)
+        except Exception as e:
+            return 500, {"error": str(e)}
+    
+    def _observe(self, path: str, status: int, latency_ms: float):
+        key = (path if (("GET", path) in self.routes or ("POST", path) in self.routes) else "other", status)
+        self.histograms.setdefault(key, LatencyHistogram()).observe(latency_ms)
+    
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload, keep_alive: bool):
+        if isinstance(payload, str):
+            body = payload.encode("utf-8")
+            content_type = "text/plain; version=0.0.4; charset=utf-8"
+        else:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            content_type = "application/json; charset=utf-8"
+        reason = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                  413: "Payload Too Large", 500: "Internal Server Error"}.get(status, "")
+        head = (
+            f"HTTP/1.1 {status} {reason}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+    
+    async def serve(self, host: str, port: int):
+        self.reload()
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_signal_handler(signal.SIGHUP, self.reload_safely)
+        except (NotImplementedError, AttributeError):
+            pass  # no SIGHUP on Windows; POST /reload still works
+        
+        print(f"🚀 Scoring service listening on http://{host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm HTTP scoring service for Channel DNA")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--dna", type=Path, default=CONFIG_DIR / "channel_dna.json")
+    parser.add_argument("--trends", type=Path, default=STATE_DIR / "trends.json",
+                        help="Trend state written by scans (read-only here)")
+    parser.add_argument("--uploads", type=Path, default=STATE_DIR / "competitor_uploads.json",
+                        help="Competitor uploads fetched by scans (read-only here)")
+    parser.add_argument("--feeds-config", type=Path, default=CONFIG_DIR / "rss_feeds.json",
+                        help="Feed config whose settings.trending thresholds scans use")
+    args = parser.parse_args()
+    
+    service = ScoringService(args.dna, args.trends, args.uploads, args.feeds_config)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Scoring service stopped")
+
+
+if __name__ == "__main__":
+    main()
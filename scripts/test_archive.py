@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Test script for the scan archive
+Checks the binary segment format (write, mmap reads, postings), appends
+with the per-channel `contains` dedupe, search ranking, size-tiered
+compaction and several processes writing to the same archive at once.
+All segments go to a temporary directory.
+"""
+
+import multiprocessing
+import tempfile
+from pathlib import Path
+
+from main import ArchiveSegment, ScanArchive
+
+CHANNEL = "Fixture Channel"
+WRITERS = 4
+SCANS_PER_WRITER = 12
+
+TITLES = [
+    "Oil prices climb as OPEC extends output cuts",
+    "Gold hits record high as investors seek safety",
+    "Egypt pound slides after central bank decision",
+    "Saudi Aramco raises oil prices for Asian buyers",
+    "Dubai property market cools as mortgage rates climb",
+    "Qatar signs new LNG supply deal with Germany",
+]
+
+
+def scored(title, score=50, item_id=None):
+    return {
+        "item": {"id": item_id or f"id-{title}", "title": title, "description": f"About {title.lower()}",
+                 "link": f"https://news.example/{abs(hash(title))}", "source": "Fixture"},
+        "score": score,
+        "status": "CONSIDER",
+    }
+
+def record(i):
+    return {"id": f"r{i}", "channel": CHANNEL, "scanned_at": 1_700_000_000 + i, "score": 10 * i,
+            "status": "CONSIDER", "title": TITLES[i], "description": "", "link": "", "source": "",
+            "published": None}
+
+
+def check(label, ok, detail=""):
+    """Print one check result and return whether it passed"""
+    print(f"{'✅' if ok else '❌'} {label}{f' ({detail})' if detail and not ok else ''}")
+    return ok
+
+def segment_checks(tmp):
+    """Write a segment and read it back through the memory map"""
+    results = []
+    records = [record(i) for i in range(len(TITLES))]
+    path = tmp / "seg_test.cia"
+    ArchiveSegment.write(path, records, ScanArchive._terms)
+    segment = ArchiveSegment(path)
+    results.append(check("Segment written atomically", path.exists() and not path.with_suffix(".tmp").exists()))
+    results.append(check("Record count in footer", segment.n_docs == len(records), str(segment.n_docs)))
+    results.append(check("Records read back unchanged", list(segment.records()) == records))
+    offset, scanned_at, score = segment.doc(3)
+    results.append(check("Doc entry has scan time and score", (scanned_at, score) == (1_700_000_003, 30),
+                         f"{scanned_at}, {score}"))
+    
+    oil = segment.postings(ScanArchive.term_hash("oil"))
+    results.append(check("Postings list every doc with the term", sorted(doc for doc, _ in oil) == [0, 3],
+                         str(oil)))
+    results.append(check("Term frequency counted", dict(oil)[3] == 1 and dict(
+        segment.postings(ScanArchive.term_hash("prices")))[3] == 1))
+    results.append(check("Absent term has no postings", segment.postings(ScanArchive.term_hash("bitcoin")) == []))
+    key = segment.postings(ScanArchive.term_hash(ScanArchive._key_term(CHANNEL, "r5")))
+    results.append(check("Item key indexed for dedupe", key == [(5, 1)], str(key)))
+    segment.close()
+    
+    bad = tmp / "seg_bad.cia"
+    bad.write_bytes(b"not an archive segment at all, just some bytes" * 2)
+    try:
+        ArchiveSegment(bad)
+        rejected = False
+    except ValueError:
+        rejected = True
+    results.append(check("File without the magic rejected", rejected))
+    return results
+
+def archive_checks(tmp):
+    """Appends, dedupe, search and compaction through ScanArchive"""
+    results = []
+    archive = ScanArchive(tmp / "archive", merge_factor=3, max_segments=4)
+    
+    first = archive.append([scored(TITLES[0], 80), scored(TITLES[1], 60), scored(TITLES[1], 60)], CHANNEL)
+    results.append(check("New items archived once per scan", first == 2, str(first)))
+    results.append(check("contains() finds archived items",
+                         archive.contains(CHANNEL, f"id-{TITLES[0]}") and not archive.contains(CHANNEL, "id-other")))
+    again = archive.append([scored(TITLES[0], 80), scored(TITLES[2], 40)], CHANNEL)
+    results.append(check("Items already archived for the channel are skipped", again == 1, str(again)))
+    other = archive.append([scored(TITLES[0], 80)], "Other Channel")
+    results.append(check("Same item archived again for another channel", other == 1, str(other)))
+    
+    archive.append([scored(TITLES[3], 70), scored(TITLES[4], 30)], CHANNEL)
+    hits = archive.search("oil prices climb")
+    results.append(check("Search ranks items matching more words first",
+                         [(h["title"], h["matched"]) for h in hits]
+                         == [(TITLES[0], 3), (TITLES[0], 3), (TITLES[3], 2), (TITLES[4], 1)],
+                         str([(h["title"], h["matched"]) for h in hits])))
+    results.append(check("Search respects the limit", len(archive.search("oil prices climb", limit=1)) == 1))
+    results.append(check("Search finds nothing for unknown words", archive.search("bitcoin") == []))
+    
+    # merge_factor=3: the third one-item segment of a tier triggers a merge
+    before = {segment.path for segment in archive.segments}
+    for i in range(6):
+        archive.append([scored(f"Compaction filler story number {chr(97 + i)}", item_id=f"filler-{i}")], CHANNEL)
+    paths = [segment.path for segment in archive.segments]
+    on_disk = sorted((tmp / "archive").glob("seg_*.cia"))
+    results.append(check("Compaction keeps the segment count down", len(paths) <= 4, str(len(paths))))
+    results.append(check("Merged segments removed from disk",
+                         sorted(paths) == on_disk and not before & set(on_disk), str(on_disk)))
+    keys = [(r["channel"], r["id"]) for segment in archive.segments for r in segment.records()]
+    results.append(check("Every item survives compaction exactly once",
+                         len(keys) == len(set(keys)) == 12, str(len(keys))))
+    results.append(check("contains() still works after compaction",
+                         archive.contains(CHANNEL, "filler-0") and archive.contains("Other Channel", f"id-{TITLES[0]}")))
+    archive.compact()
+    results.append(check("Full compaction leaves one segment",
+                         len(archive.segments) == 1 and len(list((tmp / "archive").glob("seg_*.cia"))) == 1))
+    
+    reopened = ScanArchive(tmp / "archive")
+    results.append(check("Reopened archive returns the same results",
+                         [h["id"] for h in reopened.search("oil prices climb")] == [h["id"] for h in hits]))
+    reopened.close()
+    archive.close()
+    return results
+
+def write_scans(archive_dir, writer):
+    """One writer process: overlapping scans, compacting as it goes"""
+    archive = ScanArchive(archive_dir, merge_factor=2, max_segments=3)
+    for scan in range(SCANS_PER_WRITER):
+        # Each scan shares half its items with the previous one and with the other writers
+        archive.append([scored(f"Shared story {scan}", item_id=f"shared-{scan}"),
+                        scored(f"Shared story {scan + 1}", item_id=f"shared-{scan + 1}"),
+                        scored(f"Writer {writer} story {scan}", item_id=f"w{writer}-{scan}")], CHANNEL)
+    archive.close()
+
+def concurrency_checks(tmp):
+    """Several processes appending and compacting the same archive"""
+    archive_dir = tmp / "shared"
+    context = multiprocessing.get_context("fork")
+    writers = [context.Process(target=write_scans, args=(archive_dir, w)) for w in range(WRITERS)]
+    for process in writers:
+        process.start()
+    for process in writers:
+        process.join()
+    
+    results = [check("All writers finished without errors", all(p.exitcode == 0 for p in writers),
+                     str([p.exitcode for p in writers]))]
+    archive = ScanArchive(archive_dir)
+    keys = [r["id"] for segment in archive.segments for r in segment.records()]
+    expected = SCANS_PER_WRITER + 1 + WRITERS * SCANS_PER_WRITER
+    results.append(check("No item archived twice by concurrent writers",
+                         len(keys) == len(set(keys)) == expected, f"{len(keys)} records, {len(set(keys))} unique"))
+    results.append(check("No leftover temporary segments", not list(archive_dir.glob("*.tmp"))))
+    archive.close()
+    return results
+
+def main():
+    print()
+    print("=" * 70)
+    print("Scan Archive Verification")
+    print("=" * 70)
+    print()
+    
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        results.extend(segment_checks(tmp))
+        print()
+        results.extend(archive_checks(tmp))
+        print()
+        results.extend(concurrency_checks(tmp))
+    
+    print()
+    print("=" * 70)
+    
+    if all(results):
+        print("✅ Scan archive verified successfully!")
+        return 0
+    else:
+        print(f"❌ {results.count(False)} archive checks failed")
+        return 1
+
+if __name__ == "__main__":
+    exit(main())
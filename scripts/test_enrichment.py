@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Test script for article enrichment against a local stand-in for news sites
+Serves fixture HTML, PDF and 404 pages with http.server and checks:
+extracted text, the on-disk cache, per-domain politeness and re-scoring.
+Uses a bare ContentScorer and ArticleEnricher, so no scan state is read or written.
+"""
+
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from main import ArticleEnricher, ChannelDNA, ContentScorer, HTTPClient, RSSFetcher
+
+PER_DOMAIN = 2
+DOMAIN_INTERVAL = 0.2
+RESPONSE_DELAY = 0.3  # long enough for requests to the same site to overlap
+
+ARTICLE_PAGE = """<html><head><title>{title}</title>
+<script>var tracking = "Subscribe to our newsletter today for the latest";</script></head>
+<body>
+<nav><p>Subscribe to our newsletter for markets, politics and much more news</p></nav>
+<p>Sidebar teaser outside the article body that should be ignored entirely</p>
+<article>
+<p>By staff</p>
+{paragraphs}
+<figure><p>Photo caption describing the trading floor in some detail here</p></figure>
+</article>
+<footer><p>Copyright notice and links to every other section of the site</p></footer>
+</body></html>"""
+
+ARTICLES = {
+    "/article/rates": [
+        "The central bank kept its benchmark rate unchanged on Tuesday, saying inflation "
+        "would remain elevated through the rest of the year.",
+        "Officials pointed to higher import costs and a weaker outlook for China, and said "
+        "tariffs announced by Trump could really push prices up further.",
+    ],
+    "/article/ports": ["Port operators reported steady volumes for the quarter and expect similar numbers next year."],
+    "/article/retail": ["Retail sales were broadly flat as shoppers held back on larger purchases this season."],
+    "/article/tourism": ["Hotel occupancy stayed close to last year's level according to the latest survey."],
+}
+
+ITEMS = [
+    ("Saudi central bank holds rates steady", "Policy unchanged", "/article/rates"),
+    ("Port operators publish quarterly figures", "Volumes steady", "/article/ports"),
+    ("Retail group releases sales update", "Sales flat", "/article/retail"),
+    ("Hotel survey results published", "Occupancy stable", "/article/tourism"),
+    ("Annual report now available", "Full document", "/report.pdf"),
+    ("Story that was taken down", "No longer online", "/missing"),
+]
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves the fixture pages and logs when each request started and finished."""
+    
+    requests = []
+    lock = threading.Lock()
+    
+    def do_GET(self):
+        started = time.time()
+        time.sleep(RESPONSE_DELAY)
+        if self.path in ARTICLES:
+            paragraphs = "\n".join(f"<p>{p}</p>" for p in ARTICLES[self.path])
+            body = ARTICLE_PAGE.format(title=self.path, paragraphs=paragraphs).encode()
+            self._send(200, "text/html; charset=utf-8", body)
+        elif self.path.endswith(".pdf"):
+            self._send(200, "application/pdf", b"%PDF-1.4\n% fixture\n")
+        else:
+            self._send(404, "text/html", b"<html><body><p>Not found</p></body></html>")
+        with self.lock:
+            self.requests.append((self.path, started, time.time()))
+    
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+def check(label, ok, detail=""):
+    """Print one check result and return whether it passed"""
+    print(f"{'✅' if ok else '❌'} {label}{f' ({detail})' if detail and not ok else ''}")
+    return ok
+
+def make_items(base_url):
+    items = []
+    for title, description, path in ITEMS:
+        link = base_url + path
+        items.append({
+            "title": title, "description": description, "link": link,
+            "source": "Fixture", "category": "general", "priority": 2,
+            "id": RSSFetcher.make_id(title, link),
+        })
+    return items
+
+def max_overlap(requests):
+    """Highest number of requests in flight at once"""
+    events = sorted([(start, 1) for _, start, _ in requests] + [(end, -1) for _, _, end in requests])
+    current = peak = 0
+    for _, change in events:
+        current += change
+        peak = max(peak, current)
+    return peak
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    
+    print()
+    print("=" * 70)
+    print("Article Enrichment Verification")
+    print("=" * 70)
+    print()
+    
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = Path(tmp) / "article_cache.json"
+        http = HTTPClient()
+        scorer = ContentScorer(ChannelDNA())
+        enricher = ArticleEnricher(
+            http, cache_path=cache_path, per_domain=PER_DOMAIN,
+            domain_interval_seconds=DOMAIN_INTERVAL, timeout_seconds=5,
+        )
+        
+        items = make_items(base_url)
+        by_path = {path: item for item, (_, _, path) in zip(items, ITEMS)}
+        before = {s["item"]["id"]: s for s in scorer.score_batch(items)}
+        results.append(check(
+            "All fixture items are borderline candidates",
+            len(enricher.candidates([list(before.values())])) == len(items),
+            ", ".join(f"{s['item']['title']}: {s['score']}" for s in before.values()),
+        ))
+        
+        rescored = {s["item"]["id"]: s for s in enricher.rescore([list(before.values())], [scorer])[0]}
+        print()
+        
+        # Extracted text: article paragraphs only
+        body = by_path["/article/rates"].get("body", "")
+        results.append(check("Article paragraphs extracted", "would remain elevated" in body
+                             and "push prices up further" in body, body[:120]))
+        results.append(check("Script, nav, figure, footer and non-article text dropped",
+                             not any(noise in body for noise in ("tracking", "Subscribe", "Photo caption",
+                                                                 "Copyright", "Sidebar", "By staff")), body))
+        results.append(check("PDF and 404 items get no body",
+                             "body" not in by_path["/report.pdf"] and "body" not in by_path["/missing"]))
+        
+        # Cache keyed by item id, with errors for the failures
+        cache = enricher.cache
+        results.append(check("Cache has one entry per item id", set(cache) == {i["id"] for i in items},
+                             str(sorted(cache))))
+        pdf_error = cache.get(by_path["/report.pdf"]["id"], {}).get("error") or ""
+        missing_error = cache.get(by_path["/missing"]["id"], {}).get("error") or ""
+        results.append(check("PDF cached as not HTML", pdf_error.startswith("Not HTML"), pdf_error))
+        results.append(check("404 cached as an error", "404" in missing_error, missing_error))
+        results.append(check("Cache written to disk", cache_path.exists()))
+        
+        # Politeness: request starts spaced out, bounded concurrency
+        requests = sorted(FixtureHandler.requests, key=lambda r: r[1])
+        gaps = [b[1] - a[1] for a, b in zip(requests, requests[1:])]
+        results.append(check(f"{len(items)} requests made", len(requests) == len(items), str(len(requests))))
+        results.append(check(f"Request starts at least {DOMAIN_INTERVAL}s apart",
+                             all(gap >= DOMAIN_INTERVAL - 0.05 for gap in gaps),
+                             ", ".join(f"{gap:.3f}" for gap in gaps)))
+        results.append(check(f"At most {PER_DOMAIN} requests in flight",
+                             max_overlap(requests) <= PER_DOMAIN, str(max_overlap(requests))))
+        
+        # Re-scored results: article text can add, never reject
+        rates_id = by_path["/article/rates"]["id"]
+        old, new = before[rates_id], rescored[rates_id]
+        print(f"   {old['item']['title']}: {old['score']} {old['status']} -> {new['score']} {new['status']}")
+        for reason in new["reasons"]:
+            print(f"      {reason}")
+        results.append(check("'inflation' in article text does not trigger a reject",
+                             new["status"] != "REJECT", str(new["reasons"])))
+        results.append(check("Re-scored item is flagged FULL_TEXT", "FULL_TEXT" in new["flags"]))
+        results.append(check("Article text raises the score, within the cap",
+                             old["score"] < new["score"] <= old["score"] + scorer.dna.scoring_weights.get(
+                                 "full_text_keyword_cap", 10), f"{old['score']} -> {new['score']}"))
+        unchanged = [by_path[p]["id"] for p in ("/report.pdf", "/missing")]
+        results.append(check("Items without text keep their scores",
+                             all(rescored[i]["score"] == before[i]["score"] for i in unchanged)))
+        
+        # A second run is served from the cache, failures included
+        FixtureHandler.requests.clear()
+        reloaded = ArticleEnricher(http, cache_path=cache_path)
+        again = reloaded.enrich(make_items(base_url))
+        results.append(check("Second run served from cache without requests",
+                             not FixtureHandler.requests and len(again) == len(ARTICLES),
+                             f"{len(FixtureHandler.requests)} requests, {len(again)} enriched"))
+    
+    server.shutdown()
+    print()
+    print("=" * 70)
+    
+    if all(results):
+        print("✅ Article enrichment verified successfully!")
+        return 0
+    else:
+        print(f"❌ {results.count(False)} enrichment checks failed")
+        return 1
+
+if __name__ == "__main__":
+    exit(main())
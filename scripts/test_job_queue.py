@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Test script for the distributed scan job queue
+Checks leasing, lease expiry, max_attempts, lease ownership and purge on
+SQLiteQueue and RedisQueue (via fakeredis when installed), competitor upload
+fetching, then runs a coordinated scan through in-process workers against a
+local feed server and compares it with a local scan. All state goes to a
+temporary directory.
+"""
+
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from main import CompetitorUploads, ContentIntelligenceSystem, RedisQueue, RSSFetcher, ScanWorker, SQLiteQueue
+
+try:
+    import fakeredis
+    HAS_FAKEREDIS = True
+except ImportError:
+    HAS_FAKEREDIS = False
+
+LEASE_SECONDS = 0.2
+
+NEWS_TITLES = [
+    "Saudi Aramco raises oil prices for Asian buyers",
+    "Egypt pound slides after central bank decision",
+    "Dubai property market cools as mortgage rates climb",
+    "Tesla opens first showroom in Riyadh",
+    "OPEC output cut extended into next year",
+    "China slows purchases of Gulf crude",
+    "Gold hits record high as investors seek safety",
+    "Qatar signs new LNG supply deal with Germany",
+]
+# Competitor uploads covering the first two stories
+UPLOAD_TITLES = NEWS_TITLES[:2]
+
+
+def rss_feed(titles):
+    now = format_datetime(datetime.now(timezone.utc))
+    items = "".join(
+        f"<item><title>{title}</title><link>https://news.example/{i}</link>"
+        f"<description>Markets update {i}</description><pubDate>{now}</pubDate></item>"
+        for i, title in enumerate(titles)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Fixture</title>{items}</channel></rss>'
+
+def upload_feed(titles):
+    entries = "".join(
+        f'<entry><title>{title.upper()}</title><link rel="alternate" href="https://video.example/{i}"/>'
+        f"<published>2026-01-01T00:00:00Z</published></entry>"
+        for i, title in enumerate(titles)
+    )
+    return f'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Uploads</title>{entries}</feed>'
+
+PAGES = {
+    "/news-a.xml": rss_feed(NEWS_TITLES[:5]),
+    "/news-b.xml": rss_feed(NEWS_TITLES[3:]),
+    "/uploads.xml": upload_feed(UPLOAD_TITLES),
+}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves the fixture feeds (anything else is a 404) and logs the requested paths."""
+    
+    requests = []
+    
+    def do_GET(self):
+        self.requests.append(self.path)
+        page = PAGES.get(self.path.split("?")[0])
+        body = page.encode() if page else b""
+        self.send_response(200 if page else 404)
+        self.send_header("Content-Type", "application/xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+def check(label, ok, detail=""):
+    """Print one check result and return whether it passed"""
+    print(f"{'✅' if ok else '❌'} {label}{f' ({detail})' if detail and not ok else ''}")
+    return ok
+
+def job_states(queue, scan_id, kind="fetch"):
+    return {job["id"]: job for job in queue.jobs(scan_id, kind)}
+
+def queue_checks(name, make_queue):
+    """Lease, expiry, ownership, max_attempts and purge on one backend"""
+    results = []
+    queue = make_queue(lease_seconds=LEASE_SECONDS, max_attempts=2)
+    label = f"[{name}]"
+    
+    # Enqueueing is idempotent; kinds are served in the order asked for
+    queue.put("s1:score", "score", "s1", {"n": 0})
+    queue.put("s1:a", "fetch", "s1", {"n": 1})
+    queue.put("s1:a", "fetch", "s1", {"n": 2})
+    results.append(check(f"{label} Same job ID enqueued once",
+                         [job["payload"] for job in queue.jobs("s1", "fetch")] == [{"n": 1}]))
+    job = queue.lease(["fetch", "score"], "w1")
+    results.append(check(f"{label} Lease takes the first kind asked for",
+                         job and job["id"] == "s1:a" and job["attempts"] == 1, str(job)))
+    results.append(check(f"{label} A leased job is not handed out twice", queue.lease(["fetch"], "w2") is None))
+    
+    # Lease expiry hands the job to another worker; the old holder loses it
+    time.sleep(LEASE_SECONDS + 0.1)
+    job = queue.lease(["fetch"], "w2")
+    results.append(check(f"{label} Expired lease is re-leased",
+                         job and job["id"] == "s1:a" and job["attempts"] == 2, str(job)))
+    queue.fail("s1:a", "late failure", "w1")
+    queue.complete("s1:a", {"by": "w1"}, "w1")
+    results.append(check(f"{label} Old lease holder cannot fail or complete the job",
+                         job_states(queue, "s1")["s1:a"]["state"] == "leased"))
+    queue.complete("s1:a", {"by": "w2"}, "w2")
+    queue.complete("s1:a", {"by": "w2 again"}, "w2")
+    done = job_states(queue, "s1")["s1:a"]
+    results.append(check(f"{label} Current holder completes; the first result is kept",
+                         done["state"] == "done" and done["result"] == {"by": "w2"}, str(done)))
+    
+    # max_attempts: expired leases, then explicit failures
+    queue.put("s1:b", "fetch", "s1", {})
+    for worker in ("w1", "w2"):
+        queue.lease(["fetch"], worker)
+        time.sleep(LEASE_SECONDS + 0.1)
+    results.append(check(f"{label} No lease after max_attempts expiries", queue.lease(["fetch"], "w3") is None))
+    failed = job_states(queue, "s1")["s1:b"]
+    results.append(check(f"{label} Job failed after max_attempts expiries",
+                         failed["state"] == "failed" and "Lease expired" in (failed["error"] or ""), str(failed)))
+    
+    queue.put("s1:c", "fetch", "s1", {})
+    queue.fail(queue.lease(["fetch"], "w1")["id"], "boom", "w1")
+    retried = job_states(queue, "s1")["s1:c"]
+    results.append(check(f"{label} Failed job goes back for a retry",
+                         retried["state"] == "pending" and retried["error"] == "boom", str(retried)))
+    queue.fail(queue.lease(["fetch"], "w2")["id"], "boom again", "w2")
+    results.append(check(f"{label} Failed for good after max_attempts",
+                         job_states(queue, "s1")["s1:c"]["state"] == "failed"))
+    
+    # A late result after the lease ran out is kept, and the job is not leased again
+    queue.put("s1:d", "fetch", "s1", {})
+    queue.lease(["fetch"], "w1")
+    time.sleep(LEASE_SECONDS + 0.1)
+    queue.complete("s1:d", {"late": True}, "w1")
+    results.append(check(f"{label} Late result kept and not handed out again",
+                         queue.lease(["fetch"], "w2") is None
+                         and job_states(queue, "s1")["s1:d"]["result"] == {"late": True}))
+    
+    # Purge with pending and leased jobs left over (the wait-timeout path)
+    queue.put("s2:a", "fetch", "s2", {})
+    queue.put("s2:b", "fetch", "s2", {})
+    queue.put("s3:a", "fetch", "s3", {})
+    queue.lease(["fetch"], "w1")
+    queue.purge("s1")
+    queue.purge("s2")
+    results.append(check(f"{label} Purge removes every job of the scan",
+                         not queue.jobs("s1", "fetch") and not queue.jobs("s2", "fetch")))
+    time.sleep(LEASE_SECONDS + 0.1)
+    job = queue.lease(["fetch", "score"], "w2")
+    results.append(check(f"{label} Leasing after a purge skips the purged jobs",
+                         job and job["id"] == "s3:a", str(job)))
+    results.append(check(f"{label} Nothing else to lease", queue.lease(["fetch", "score"], "w2") is None))
+    queue.purge("s3")
+    results.append(check(f"{label} Nothing left after purging every scan", queue_is_empty(queue)))
+    return results
+
+def queue_is_empty(queue):
+    if isinstance(queue, RedisQueue):
+        return not queue.redis.keys("*")
+    return queue._db().execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 0
+
+def competitor_checks(base_url, tmp):
+    """Uploads are fetched once per channel, through the circuit breaker, and kept"""
+    results = []
+    state_dir = tmp / "competitors"
+    state_dir.mkdir()
+    channels = [
+        {"name": "Channel One", "channel_id": "UC1"},
+        {"name": "Channel Two", "channel_id": "UC2"},
+        {"name": "Channel One", "channel_id": "UC1"},  # listed by a second profile
+    ]
+    fetcher = RSSFetcher(state_dir=state_dir)
+    uploads = CompetitorUploads(state_dir / "competitor_uploads.json")
+    FixtureHandler.requests.clear()
+    uploads.fetch(channels, fetcher)
+    uploads.save()
+    results.append(check("Each competitor channel fetched once",
+                         sorted(FixtureHandler.requests) == ["/uploads.xml?channel_id=UC1",
+                                                              "/uploads.xml?channel_id=UC2"],
+                         str(FixtureHandler.requests)))
+    results.append(check("Uploads of every listed channel returned",
+                         len(uploads.videos(channels)) == 3 * len(UPLOAD_TITLES)))
+    
+    # An unreachable channel opens its circuit and stops being requested
+    uploads.YOUTUBE_FEED_URL = base_url + "/gone.xml?channel_id={}"
+    threshold = fetcher.health.failure_threshold
+    FixtureHandler.requests.clear()
+    for _ in range(threshold + 2):
+        uploads.fetch(channels[:1], fetcher)
+    results.append(check("Competitor fetches stop once the circuit opens",
+                         len(FixtureHandler.requests) == threshold
+                         and fetcher.health.feeds["YouTube: Channel One"]["state"] == "open",
+                         f"{len(FixtureHandler.requests)} requests"))
+    reloaded = CompetitorUploads(state_dir / "competitor_uploads.json")
+    results.append(check("Uploads of the last good fetch are kept",
+                         reloaded.videos(channels[:1]) == uploads.videos(channels[:1])
+                         and len(reloaded.videos(channels[:1])) == len(UPLOAD_TITLES)))
+    return results
+
+def summary(results):
+    return [(s["score"], s["item"]["title"], sorted(s["flags"])) for s in results]
+
+def make_system(base_url, tmp, name):
+    system = ContentIntelligenceSystem(state_dir=tmp / name / "state", output_dir=tmp / name / "output")
+    system.enricher = None
+    system.fetcher.feeds = [
+        {"name": "News A", "url": f"{base_url}/news-a.xml", "priority": 1},
+        {"name": "News B", "url": f"{base_url}/news-b.xml", "priority": 2},
+        {"name": "Gone", "url": f"{base_url}/gone.xml", "priority": 2},
+    ]
+    system.fetcher.settings["queue"] = {"score_chunk": 3, "wait_seconds": 30}
+    return system
+
+def coordinated_scan_checks(name, queue, base_url, tmp, local):
+    """A coordinated scan through two workers gives the same results as a local scan"""
+    results = []
+    label = f"[{name}]"
+    for _ in range(2):
+        threading.Thread(target=ScanWorker(queue, poll_seconds=0.1).run, daemon=True).start()
+    
+    system = make_system(base_url, tmp, f"coordinated_{name}")
+    system.run_coordinated_scan(queue, all_feeds=True)
+    print()
+    results.append(check(f"{label} Coordinated scan matches a local scan",
+                         system.last_results is not None and summary(system.last_results) == local,
+                         f"{len(local)} local items"))
+    health = system.fetcher.health.feeds
+    results.append(check(f"{label} Fetch errors from workers update feed health",
+                         health["Gone"]["failures"] == 1 and health["News A"]["successes"] == 1))
+    results.append(check(f"{label} Scan jobs purged", queue_is_empty(queue)))
+    return results
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    # Competitor uploads come from the fixture server instead of YouTube
+    CompetitorUploads.YOUTUBE_FEED_URL = base_url + "/uploads.xml?channel_id={}"
+    
+    print()
+    print("=" * 70)
+    print("Job Queue Verification")
+    print("=" * 70)
+    print()
+    
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        backends = [("sqlite", lambda **options: SQLiteQueue(tmp / "jobs.sqlite3", **options))]
+        if HAS_FAKEREDIS:
+            backends.append(("redis", lambda **options: RedisQueue(
+                client=fakeredis.FakeRedis(decode_responses=True), **options)))
+        else:
+            print('⚠️  fakeredis not installed, skipping RedisQueue. Run: pip install "fakeredis[lua]"')
+        
+        for name, make_queue in backends:
+            results.extend(queue_checks(name, make_queue))
+            print()
+        
+        results.extend(competitor_checks(base_url, tmp))
+        print()
+        
+        # Reference: the same feeds scanned in one process
+        local_system = make_system(base_url, tmp, "local")
+        local_system.run_full_scan(all_feeds=True)
+        local = summary(local_system.last_results)
+        covered = sum("COMPETITOR_COVERED" in flags for _, _, flags in local)
+        print()
+        results.append(check("Local scan flags the stories competitors covered",
+                             covered == len(UPLOAD_TITLES), str(covered)))
+        
+        for name, make_queue in backends:
+            results.extend(coordinated_scan_checks(name, make_queue(), base_url, tmp, local))
+            print()
+        
+        # Without workers nothing finishes: feed health and schedules are left alone
+        idle = make_system(base_url, tmp, "idle")
+        idle.fetcher.settings["queue"]["wait_seconds"] = 1
+        idle.run_coordinated_scan(SQLiteQueue(tmp / "idle.sqlite3"), all_feeds=True)
+        print()
+        results.append(check("Unfinished fetch jobs are not counted as feed failures",
+                             all(state["failures"] == 0 for state in idle.fetcher.health.feeds.values())))
+        results.append(check("Unfinished feeds stay due",
+                             len(idle.scheduler.due_feeds(idle.fetcher.feeds)) == len(idle.fetcher.feeds)))
+    
+    server.shutdown()
+    print()
+    print("=" * 70)
+    
+    if all(results):
+        print("✅ Job queue verified successfully!")
+        return 0
+    else:
+        print(f"❌ {results.count(False)} job queue checks failed")
+        return 1
+
+if __name__ == "__main__":
+    exit(main())